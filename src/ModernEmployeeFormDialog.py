@@ -33,27 +33,8 @@ class ModernEmployeeFormDialog(QDialog):
         self.setWindowTitle("Employee Details" if employee else "New Employee")
         self.setMinimumSize(600, 750)
         self.employee = employee or Employee()
+        self.setObjectName("employeeForm")  # styled by QDialog#employeeForm in style.qss
         self.init_ui()
-        self.setup_style()
-
-    def setup_style(self):
-        self.setStyleSheet("""
-            QDialog { background-color: #f8fafc; }
-            QScrollBar:vertical {
-                border: none;
-                background: #f1f5f9;
-                width: 12px;
-                margin: 0px 0px 0px 0px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3b82f6;
-                min-height: 20px;
-                border-radius: 6px;
-            }
-            QScrollBar::add-line, QScrollBar::sub-line { height: 0; }
-            QScrollBar::add-page, QScrollBar::sub-page { background: none; }
-        """)
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -63,7 +44,7 @@ class ModernEmployeeFormDialog(QDialog):
         # --- Header ---
         header_layout = QHBoxLayout()
         title = QLabel("👤 Employee Information")
-        title.setStyleSheet("font-size: 20px; font-weight: 700; color: #1f2937; margin-bottom: 8px;")
+        title.setObjectName("formTitle")
         header_layout.addWidget(title)
         header_layout.addStretch()
         layout.addLayout(header_layout)
@@ -71,7 +52,7 @@ class ModernEmployeeFormDialog(QDialog):
         # --- Scroll Area ---
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
+        scroll.setObjectName("formScroll")
 
         form_widget = QWidget()
         form_layout = QVBoxLayout(form_widget)
@@ -200,10 +181,7 @@ class ModernEmployeeFormDialog(QDialog):
         notes_card = ModernCard("📝 Additional Notes")
         self.notes_edit = QTextEdit(getattr(self.employee, "notes", "") or "")
         self.notes_edit.setMaximumHeight(100)
-        self.notes_edit.setStyleSheet("""
-            QTextEdit { background-color: white; border: 2px solid #e5e7eb; border-radius: 12px; padding: 12px 16px; font-size: 14px; color: #374151; }
-            QTextEdit:focus { border-color: #3b82f6; }
-        """)
+        self.notes_edit.setObjectName("notesEdit")
         notes_card.add_widget(self.notes_edit)
         form_layout.addWidget(notes_card)
 
@@ -0,0 +1,71 @@
+# amount_words.py
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+_ONES = [
+    "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
+    "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
+    "seventeen", "eighteen", "nineteen",
+]
+_TENS = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
+
+CRORE = 10 ** 7
+LAKH = 10 ** 5
+
+
+def _below_thousand(n: int) -> str:
+    hundreds, rest = divmod(n, 100)
+    if rest < 20:
+        words = _ONES[rest]
+    else:
+        tens, ones = divmod(rest, 10)
+        words = _TENS[tens] + (f"-{_ONES[ones]}" if ones else "")
+    if not hundreds:
+        return words
+    return f"{_ONES[hundreds]} hundred" + (f" and {words}" if rest else "")
+
+
+# Precomputed words for every group value 0-999
+_BELOW_THOUSAND = tuple(_below_thousand(n) for n in range(1000))
+
+
+@lru_cache(maxsize=4096)
+def integer_to_words(n: int) -> str:
+    """Spell a non-negative integer using Indian (lakh/crore) grouping.
+
+    Wording follows num2words' en_IN output: groups are comma separated and a
+    trailing group below one hundred is joined with "and".
+    Amounts of a hundred crore and above are spelled as "<n> crore".
+    """
+    if n < 1000:
+        return _BELOW_THOUSAND[n]
+
+    crores, n = divmod(n, CRORE)
+    lakhs, n = divmod(n, LAKH)
+    thousands, rest = divmod(n, 1000)
+
+    parts = []
+    if crores:
+        parts.append(f"{integer_to_words(crores)} crore")
+    if lakhs:
+        parts.append(f"{_BELOW_THOUSAND[lakhs]} lakh")
+    if thousands:
+        parts.append(f"{_BELOW_THOUSAND[thousands]} thousand")
+
+    words = ", ".join(parts)
+    if not rest:
+        return words
+    return f"{words} and {_BELOW_THOUSAND[rest]}" if rest < 100 else f"{words}, {_BELOW_THOUSAND[rest]}"
+
+
+@lru_cache(maxsize=8192)
+def rupees_in_words(amount) -> str:
+    """Return e.g. "One Thousand, Two Hundred And Thirty-Four Rupees, Fifty Paise Only"."""
+    value = Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    rupees, paise = divmod(int(abs(value) * 100), 100)
+
+    words = (f"{integer_to_words(rupees)} {'rupee' if rupees == 1 else 'rupees'}, "
+             f"{integer_to_words(paise)} {'paisa' if paise == 1 else 'paise'}")
+    if value < 0:
+        words = f"minus {words}"
+    return words.title() + " Only"
@@ -0,0 +1,225 @@
+# batch_payslips.py
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence
+
+import instrumentation
+from db import ensure_db
+from employee_store import get_store
+
+@dataclass
+class PayslipResult:
+    """Outcome of generating a single payslip."""
+    employee_id: int
+    path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    output_bytes: int = 0
+    skipped: bool = False  # incremental run found the PDF already up to date
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchProgress:
+    """Progress event streamed after every completed work unit."""
+    done: int
+    total: int
+    elapsed: float
+    results: List[PayslipResult] = field(default_factory=list)
+
+
+@dataclass
+class BatchReport:
+    """Summary of a finished batch run."""
+    total: int = 0
+    elapsed: float = 0.0
+    results: List[PayslipResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[PayslipResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failures(self) -> List[PayslipResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def skipped(self) -> List[PayslipResult]:
+        return [r for r in self.results if r.skipped]
+
+    @property
+    def generated(self) -> List[PayslipResult]:
+        """Payslips actually rendered this run (succeeded minus skipped)."""
+        return [r for r in self.results if r.ok and not r.skipped]
+
+    @property
+    def output_bytes(self) -> int:
+        return sum(r.output_bytes for r in self.generated)
+
+    @property
+    def bytes_per_payslip(self) -> float:
+        generated = self.generated
+        return self.output_bytes / len(generated) if generated else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Payslips generated per second (skipped ones are not counted)."""
+        return len(self.generated) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def select_employee_ids(db_path, department: Optional[str] = None, status: Optional[str] = "Active",
+                        employee_ids: Optional[Sequence[int]] = None) -> List[int]:
+    """Resolve the employee filter to a list of ids (in name order)."""
+    rows = get_store(db_path).filter(department=department, status=status)
+    if employee_ids is not None:
+        wanted = set(employee_ids)
+        rows = [e for e in rows if e["id"] in wanted]
+    return [e["id"] for e in rows]
+
+
+def check_output_names(db_path, employee_ids: Sequence[int], pay_period: str) -> None:
+    """Raise ValueError if two of the employees' payslips would be written to the same file."""
+    from payslip_generator import payslip_filename
+    store = get_store(db_path)
+    owners, clashes = {}, []
+    for emp_id in employee_ids:
+        name = payslip_filename(store.get(emp_id) or {}, emp_id, pay_period, Path()).name
+        if name in owners:
+            clashes.append(f"{name} (employees {owners[name]} and {emp_id})")
+        owners.setdefault(name, emp_id)
+    if clashes:
+        raise ValueError("Payslips would overwrite each other: " + ", ".join(clashes[:5])
+                         + (f" and {len(clashes) - 5} more" if len(clashes) > 5 else ""))
+
+
+def _init_worker(timing_enabled: bool = False, optimised: bool = False):
+    """Pool initializer: set up this worker's generator (fonts, styles) once."""
+    from payslip_generator import get_generator
+    instrumentation.enable(timing_enabled)
+    get_generator(optimised)
+
+
+def _generate_chunk(db_path: str, employee_ids: List[int], pay_period: str, output_dir: str,
+                    incremental: bool = False, renderer: str = "platypus",
+                    optimised: bool = False) -> List[PayslipResult]:
+    """Generate one work unit of payslips with this process's generator."""
+    from payslip_generator import get_generator
+    generator = get_generator(optimised)
+    results = []
+    for emp_id in employee_ids:
+        start = time.perf_counter()
+        try:
+            if incremental:
+                path, rebuilt = generator.generate_pdf_incremental(
+                    db_path, emp_id, pay_period, output_dir, renderer)
+            else:
+                path = generator.generate_pdf(db_path, emp_id, pay_period, output_dir, renderer)
+                rebuilt = True
+            results.append(PayslipResult(emp_id, path=path, seconds=time.perf_counter() - start,
+                                         output_bytes=os.path.getsize(path), skipped=not rebuilt))
+        except Exception as e:
+            results.append(PayslipResult(emp_id, error=str(e), seconds=time.perf_counter() - start))
+    return results
+
+
+def _run_pool_chunk(*args):
+    """Pool entry point: the chunk's results plus the stage timings it recorded."""
+    results = _generate_chunk(*args)
+    samples = instrumentation.timings.drain() if instrumentation.is_enabled() else None
+    return results, samples
+
+
+def _chunks(items: List[int], size: int) -> Iterator[List[int]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def iter_batch(db_path, pay_period: str, output_dir, department: Optional[str] = None,
+               status: Optional[str] = "Active", employee_ids: Optional[Sequence[int]] = None,
+               workers: Optional[int] = None, chunk_size: Optional[int] = None,
+               incremental: bool = False, renderer: str = "platypus",
+               optimised: bool = False) -> Iterator[BatchProgress]:
+    """Generate payslips for every matching employee, yielding progress per work unit.
+
+    workers defaults to the CPU count; workers=1 runs in-process without a pool.
+    chunk_size defaults to roughly four work units per worker.
+    incremental skips payslips whose manifest entry shows they are up to date.
+    renderer selects the page renderer ("platypus" or "canvas").
+    optimised produces the smallest files (see ModernPayslipGenerator).
+    """
+    ids = select_employee_ids(db_path, department, status, employee_ids)
+    check_output_names(db_path, ids, pay_period)
+    total = len(ids)
+    workers = max(1, min(workers or os.cpu_count() or 1, total or 1))
+    chunk_size = chunk_size or max(1, -(-total // (workers * 4)))
+    db_path, output_dir = str(db_path), str(output_dir)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if incremental:
+        ensure_db(Path(db_path))  # make sure the manifest table exists
+
+    start = time.perf_counter()
+    done = 0
+    if workers == 1:
+        for chunk in _chunks(ids, chunk_size):
+            results = _generate_chunk(db_path, chunk, pay_period, output_dir, incremental, renderer, optimised)
+            done += len(results)
+            yield BatchProgress(done, total, time.perf_counter() - start, results)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(instrumentation.is_enabled(), optimised)) as pool:
+        futures = {
+            pool.submit(_run_pool_chunk, db_path, chunk, pay_period, output_dir,
+                        incremental, renderer, optimised): chunk
+            for chunk in _chunks(ids, chunk_size)
+        }
+        for future in as_completed(futures):
+            try:
+                results, samples = future.result()
+                if samples:
+                    instrumentation.timings.merge(samples)
+            except Exception as e:
+                # The worker itself died; mark the whole unit failed
+                results = [PayslipResult(emp_id, error=f"Worker failed: {e}") for emp_id in futures[future]]
+            done += len(results)
+            yield BatchProgress(done, total, time.perf_counter() - start, results)
+
+
+def run_batch(db_path, pay_period: str, output_dir,
+              on_progress: Optional[Callable[[BatchProgress], None]] = None, **kwargs) -> BatchReport:
+    """Run iter_batch to completion and return a BatchReport.
+
+    Accepts the same filter/pool keyword arguments as iter_batch. Stage
+    timings are reset first so the logged breakdown covers this batch only.
+    """
+    instrumentation.timings.reset()
+    report = BatchReport()
+    start = time.perf_counter()
+    for progress in iter_batch(db_path, pay_period, output_dir, **kwargs):
+        report.total = progress.total
+        report.results.extend(progress.results)
+        if on_progress:
+            on_progress(progress)
+    report.elapsed = time.perf_counter() - start
+    instrumentation.log_event("batch_finished", pay_period=pay_period, total=report.total,
+                              generated=len(report.generated), failed=len(report.failures), skipped=len(report.skipped),
+                              elapsed_s=round(report.elapsed, 3), per_s=round(report.throughput, 2),
+                              bytes_per_payslip=round(report.bytes_per_payslip))
+    if instrumentation.is_enabled():
+        instrumentation.timings.log_summary()
+    return report
+
+
+def generate_consolidated(db_path, pay_period: str, output_path, department: Optional[str] = None,
+                          status: Optional[str] = "Active", employee_ids: Optional[Sequence[int]] = None,
+                          optimised: bool = False) -> str:
+    """Build the whole pay period as a single multi-page PDF (one page and bookmark per employee)."""
+    from payslip_generator import get_generator
+    ids = select_employee_ids(db_path, department, status, employee_ids)
+    return get_generator(optimised).generate_consolidated_pdf(str(db_path), ids, pay_period, str(output_path))
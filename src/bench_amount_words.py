@@ -0,0 +1,119 @@
+# bench_amount_words.py
+"""Compare amount_words against num2words: parity check and batch benchmark.
+
+    python bench_amount_words.py --verify 1000000 --payslips 10000
+
+num2words is only needed for this script, not by the application.
+"""
+import argparse
+import random
+import time
+
+from amount_words import integer_to_words, rupees_in_words
+
+
+def legacy_words(amount) -> str:
+    """The conversion payslip_generator used before amount_words existed."""
+    from num2words import num2words
+    amt_words = num2words(amount, to='currency', lang='en_IN')
+    amt_words = amt_words.replace("euro", "Rupees").replace("cents", "Paise")
+    return amt_words.title() + " Only"
+
+
+def verify(limit: int, samples: int, seed: int = 0) -> int:
+    """Compare integer wording for 0..limit and currency wording on random amounts.
+
+    Returns the number of mismatches (the first few are printed).
+    """
+    from num2words import num2words
+
+    mismatches = 0
+
+    def report(kind, value, expected, got):
+        nonlocal mismatches
+        mismatches += 1
+        if mismatches <= 10:
+            print(f"MISMATCH {kind} {value!r}: num2words={expected!r} native={got!r}")
+
+    for n in range(limit + 1):
+        expected = num2words(n, lang='en_IN')
+        got = integer_to_words(n)
+        if expected != got:
+            report("int", n, expected, got)
+
+    rng = random.Random(seed)
+    for _ in range(samples):
+        # Plural amounts only: the legacy path left singular "euro"/"cent" untranslated
+        amount = round(rng.uniform(2, 10_000_000), 2)
+        if round(amount * 100) % 100 == 1:
+            continue
+        expected = legacy_words(amount)
+        got = rupees_in_words(amount)
+        if expected != got:
+            report("currency", amount, expected, got)
+
+    return mismatches
+
+
+def synthetic_net_pays(count: int, seed: int = 0):
+    """Monthly net pays with the repetition a real payroll has (shared pay bands)."""
+    rng = random.Random(seed)
+    bands = [round(rng.uniform(15_000, 400_000), 2) for _ in range(max(1, count // 10))]
+    return [rng.choice(bands) for _ in range(count)]
+
+
+def bench(payslips: int, repeat: int = 3):
+    amounts = synthetic_net_pays(payslips)
+    results = {}
+
+    def timed(label, fn, before=None):
+        best = float("inf")
+        for _ in range(repeat):
+            if before:
+                before()
+            start = time.perf_counter()
+            for amount in amounts:
+                fn(amount)
+            best = min(best, time.perf_counter() - start)
+        results[label] = best
+        print(f"{label:<24} {best * 1000:10.2f} ms  ({best / len(amounts) * 1e6:.2f} us/payslip)")
+
+    try:
+        import num2words  # noqa: F401
+        timed("num2words (legacy)", legacy_words)
+    except ImportError:
+        print("num2words not installed; skipping legacy timing")
+
+    def clear_caches():
+        rupees_in_words.cache_clear()
+        integer_to_words.cache_clear()
+
+    timed("native (cold cache)", rupees_in_words, before=clear_caches)
+    timed("native (warm cache)", rupees_in_words)
+
+    legacy = results.get("num2words (legacy)")
+    if legacy:
+        print(f"speedup: {legacy / results['native (cold cache)']:.1f}x cold, "
+              f"{legacy / results['native (warm cache)']:.1f}x warm")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verify", type=int, metavar="N", default=0,
+                        help="check integer wording for 0..N against num2words")
+    parser.add_argument("--samples", type=int, default=100_000,
+                        help="random currency amounts checked with --verify")
+    parser.add_argument("--payslips", type=int, default=10_000, help="amounts per benchmark run")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        mismatches = verify(args.verify, args.samples)
+        print(f"verify: {mismatches} mismatches")
+        if mismatches:
+            raise SystemExit(1)
+    bench(args.payslips)
+
+
+if __name__ == "__main__":
+    main()
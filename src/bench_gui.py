@@ -0,0 +1,185 @@
+# bench_gui.py
+"""GUI latency benchmark: drives ModernMainWindow offscreen against synthetic databases.
+
+    python bench_gui.py --sizes 100 1000 10000
+
+Measures time to first window paint, the employees page's refresh_data,
+per-keystroke search handling and the debounced search's time to results,
+page switches, payslip preview updates, and widget construction (to first
+render) and window repaint times, which are dominated by stylesheet handling.
+Results are written as JSON to bench_results/ for comparison across runs.
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # must be set before Qt is imported
+
+import argparse
+import json
+import platform
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from bench_payslips import RESULTS_DIR, percentile, seed_synthetic_employees
+
+DEFAULT_SIZES = (100, 1000, 10000)
+SEARCH_TEXT = "asha kul"
+
+
+def summarise(samples) -> dict:
+    values = sorted(samples)
+    return {
+        "count": len(values),
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p90_ms": percentile(values, 90) * 1000,
+        "max_ms": (values[-1] if values else 0.0) * 1000,
+    }
+
+
+def settle(app):
+    """Run the event loop until queued work (deferred loads, repaints) is done."""
+    for _ in range(3):
+        app.processEvents()
+
+
+def wait_for(app, condition, timeout: float = 30.0):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def timed_call(app, fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    settle(app)
+    return time.perf_counter() - start
+
+
+def construct_and_render(factory):
+    widget = factory()
+    widget.resize(1200, 800)
+    widget.grab()  # polish, lay out and paint once without showing it
+    return widget
+
+
+def run_size(app, size: int, repeat: int, previews: int) -> dict:
+    import main as app_main
+    from ModernEmployeeFormDialog import ModernEmployeeFormDialog
+
+    with tempfile.TemporaryDirectory(prefix="gui_bench_") as tmp:
+        db_path = Path(tmp) / "bench.db"
+        seed_synthetic_employees(db_path, size)
+        app_main.DB_PATH = db_path
+        result = {"size": size}
+
+        # Window construction to first paint, then to the employees table being filled
+        start = time.perf_counter()
+        window = app_main.ModernMainWindow()
+        window.resize(1600, 1000)
+        window.show()
+        while not window.first_paint_done:
+            app.processEvents()
+        result["time_to_first_paint_ms"] = (time.perf_counter() - start) * 1000
+        settle(app)
+        result["time_to_data_ms"] = (time.perf_counter() - start) * 1000
+        QThreadPool.globalInstance().waitForDone()  # keep the generator warm-up out of the timings
+
+        # Widget construction through first render, and repaint of the whole window
+        factories = {
+            "construct_employees_page": window.create_employees_page,
+            "construct_payslip_page": window.create_payslip_page,
+            "construct_employee_form": ModernEmployeeFormDialog,
+        }
+        for label, factory in factories.items():
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                widget = construct_and_render(factory)
+                samples.append(time.perf_counter() - start)
+                widget.deleteLater()
+                settle(app)
+            result[label] = summarise(samples)
+        result["window_repaint"] = summarise([timed_call(app, window.repaint) for _ in range(repeat)])
+
+        employees = window.page(0)
+        result["refresh_data"] = summarise([timed_call(app, employees.refresh_data) for _ in range(repeat)])
+
+        keystrokes, searches = [], []
+        pipeline = employees.search_pipeline
+        for _ in range(repeat):
+            employees.search_input.clear()
+            wait_for(app, pipeline.is_idle)
+            for i in range(1, len(SEARCH_TEXT) + 1):
+                keystrokes.append(timed_call(app, employees.search_input.setText, SEARCH_TEXT[:i]))
+            # Typing pause: the debounced query runs now, time until the table shows its results
+            searches.append(timed_call(app, lambda: (pipeline.flush(), wait_for(app, pipeline.is_idle))))
+        employees.search_input.clear()
+        wait_for(app, pipeline.is_idle)
+        result["filter_keystroke"] = summarise(keystrokes)
+        result["search_results"] = summarise(searches)
+
+        result["page_switch_first_ms"] = timed_call(app, window.on_page_changed, 1) * 1000
+        switches = []
+        for _ in range(repeat):
+            switches.append(timed_call(app, window.on_page_changed, 0))
+            switches.append(timed_call(app, window.on_page_changed, 1))
+        result["page_switch"] = summarise(switches)
+
+        payslips = window.page(1)
+        combo = payslips.employee_combo
+        indexes = range(1, min(previews, combo.count() - 1) + 1)
+        for label in ("update_preview_first", "update_preview_repeat"):
+            result[label] = summarise([timed_call(app, combo.setCurrentIndex, i) for i in indexes])
+            combo.setCurrentIndex(0)
+            settle(app)
+
+        window.close()
+        window.deleteLater()
+        settle(app)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per measurement")
+    parser.add_argument("--previews", type=int, default=200, help="employees stepped through in the preview")
+    parser.add_argument("--output", type=Path, help="JSON results file (default: bench_results/gui_<time>.json)")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    import main as app_main
+    app_main.load_stylesheet(app)  # as main() does, before any widget is built
+    scenarios = []
+    for size in args.sizes:
+        result = run_size(app, size, args.repeat, args.previews)
+        scenarios.append(result)
+        print(f"{size:>6}  first paint {result['time_to_first_paint_ms']:7.1f} ms  "
+              f"data {result['time_to_data_ms']:7.1f} ms  "
+              f"refresh p50 {result['refresh_data']['p50_ms']:7.1f} ms  "
+              f"keystroke p50 {result['filter_keystroke']['p50_ms']:6.1f} ms  "
+              f"search p50 {result['search_results']['p50_ms']:6.1f} ms  "
+              f"switch p50 {result['page_switch']['p50_ms']:6.1f} ms  "
+              f"preview p50 {result['update_preview_first']['p50_ms']:6.1f} ms  "
+              f"construct p50 {result['construct_employees_page']['p50_ms']:6.1f} ms  "
+              f"repaint p50 {result['window_repaint']['p50_ms']:6.1f} ms")
+
+    output = args.output or RESULTS_DIR / f"gui_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "benchmark": "gui",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+        "scenarios": scenarios,
+    }, indent=2), encoding="utf-8")
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# bench_payslips.py
+"""Payslip generation benchmark against synthetic workforces.
+
+    python bench_payslips.py --sizes 1 100 1000 10000 --modes single batch parallel
+
+Every (size, mode) scenario runs in a fresh interpreter against a temporary
+database, so peak RSS is per scenario. Results are written as JSON to
+bench_results/ for comparison across runs.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from db import ensure_db, get_conn
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = BASE_DIR / "bench_results"
+
+DEFAULT_SIZES = (1, 100, 1000, 10000)
+MODES = ("single", "batch", "parallel")
+
+_DEPARTMENTS = ["Sales", "Production", "Quality", "R&D", "Finance", "HR", "Logistics", "IT"]
+_DESIGNATIONS = ["Executive", "Senior Executive", "Manager", "Chemist", "Analyst", "Officer"]
+_FIRST = ["Asha", "Rohan", "Priya", "Vikram", "Neha", "Arjun", "Kavya", "Sanjay", "Meera", "Rahul"]
+_LAST = ["Kulkarni", "Sharma", "Iyer", "Patel", "Nair", "Deshmukh", "Reddy", "Joshi", "Gupta", "Rao"]
+
+
+def seed_synthetic_employees(db_path, count: int, seed: int = 0) -> None:
+    """Create the schema in db_path and insert count synthetic employees."""
+    db_path = Path(db_path)
+    ensure_db(db_path)
+    rng = random.Random(seed)
+    rows = []
+    for i in range(1, count + 1):
+        rows.append({
+            "emp_code": f"EMP{i:05d}",
+            "name": f"{rng.choice(_FIRST)} {rng.choice(_LAST)} {i}",
+            "designation": rng.choice(_DESIGNATIONS),
+            "department": rng.choice(_DEPARTMENTS),
+            "bank_account": f"{rng.randrange(10**11, 10**12)}",
+            "ifsc": f"HDFC0{rng.randrange(100000, 999999)}",
+            "pan": f"ABCDE{i % 10000:04d}F",
+            "joining_date": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2005, 2025)}",
+            "notes": "",
+            "basic": round(rng.uniform(15000, 150000), 2),
+            "hra": round(rng.uniform(5000, 60000), 2),
+            "LTA": round(rng.choice([0, 1250, 2500]), 2),
+            "special_allowance": round(rng.uniform(0, 20000), 2),
+            "income_tax": round(rng.uniform(0, 30000), 2),
+            "status": "Active" if rng.random() < 0.9 else "Inactive",
+        })
+    conn = get_conn(db_path)
+    try:
+        conn.executemany("""
+            INSERT INTO employees
+            (emp_code, name, designation, department, bank_account, ifsc, pan, joining_date, notes,
+             basic, hra, LTA, special_allowance, income_tax, status)
+            VALUES
+            (:emp_code, :name, :designation, :department, :bank_account, :ifsc, :pan, :joining_date, :notes,
+             :basic, :hra, :LTA, :special_allowance, :income_tax, :status)
+        """, rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process plus its (finished) children, if measurable."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset  # Windows only
+        except (ImportError, AttributeError):
+            return None
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is KiB on Linux, bytes on macOS
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return max(own, children)
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def run_scenario(size: int, mode: str, pay_period: str, workers: int, renderer: str,
+                 optimised: bool = False) -> dict:
+    """Run one scenario in this process and return its measurements."""
+    from batch_payslips import run_batch, select_employee_ids
+    from payslip_generator import get_generator
+
+    with tempfile.TemporaryDirectory(prefix="payslip_bench_") as tmp:
+        db_path = Path(tmp) / "bench.db"
+        out_dir = Path(tmp) / "out"
+        seed_synthetic_employees(db_path, size)
+
+        start = time.perf_counter()
+        if mode == "single":
+            generator = get_generator(optimised)
+            latencies, failures = [], 0
+            for emp_id in select_employee_ids(db_path, status=None):
+                t0 = time.perf_counter()
+                try:
+                    generator.generate_pdf(str(db_path), emp_id, pay_period, str(out_dir), renderer)
+                except Exception:
+                    failures += 1
+                latencies.append(time.perf_counter() - t0)
+        else:
+            report = run_batch(db_path, pay_period, out_dir, status=None, renderer=renderer,
+                               optimised=optimised, workers=1 if mode == "batch" else workers)
+            latencies = [r.seconds for r in report.results]
+            failures = len(report.failures)
+        elapsed = time.perf_counter() - start
+
+        files = list(out_dir.glob("*.pdf")) if out_dir.exists() else []
+        output_bytes = sum(f.stat().st_size for f in files)
+
+    latencies.sort()
+    generated = len(latencies) - failures
+    return {
+        "size": size,
+        "mode": mode,
+        "renderer": renderer,
+        "optimised": optimised,
+        "workers": workers if mode == "parallel" else 1,
+        "payslips": generated,
+        "failures": failures,
+        "elapsed_s": elapsed,
+        "throughput_per_s": generated / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 50) * 1000,
+            "p90": percentile(latencies, 90) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+            "max": (latencies[-1] if latencies else 0.0) * 1000,
+        },
+        "peak_rss_bytes": peak_rss_bytes(),
+        "output_bytes": output_bytes,
+        "bytes_per_payslip": output_bytes / generated if generated else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--renderer", default="platypus")
+    parser.add_argument("--period", default="December 2025")
+    parser.add_argument("--optimised", action="store_true", help="benchmark the optimised-output mode")
+    parser.add_argument("--output", type=Path, help="JSON results file (default: bench_results/payslips_<time>.json)")
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)  # internal: run one scenario, print JSON
+    args = parser.parse_args(argv)
+
+    if args.scenario:
+        size, mode = args.scenario.split(":")
+        print(json.dumps(run_scenario(int(size), mode, args.period, args.workers, args.renderer,
+                                      args.optimised)))
+        return
+
+    scenarios = []
+    for size in args.sizes:
+        for mode in args.modes:
+            proc = subprocess.run(
+                [sys.executable, str(Path(__file__).resolve()), "--scenario", f"{size}:{mode}",
+                 "--workers", str(args.workers), "--renderer", args.renderer, "--period", args.period]
+                + (["--optimised"] if args.optimised else []),
+                capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                print(f"{size:>6} {mode:<8} FAILED\n{proc.stderr}", file=sys.stderr)
+                continue
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            scenarios.append(result)
+            rss = result["peak_rss_bytes"]
+            print(f"{size:>6} {mode:<8} {result['throughput_per_s']:8.1f}/s  "
+                  f"p50 {result['latency_ms']['p50']:7.1f} ms  p99 {result['latency_ms']['p99']:7.1f} ms  "
+                  f"rss {rss / 2**20 if rss else float('nan'):7.1f} MiB  "
+                  f"{result['bytes_per_payslip'] / 1024:6.1f} KiB/payslip")
+
+    output = args.output or RESULTS_DIR / f"payslips_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "benchmark": "payslips",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scenarios": scenarios,
+    }, indent=2), encoding="utf-8")
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# bench_renderers.py
+"""Compare the canvas fast-path renderer with the platypus renderer.
+
+    python bench_renderers.py --payslips 200
+
+Checks that both renderers place the same text at (nearly) the same positions
+and times both. Text extraction needs pypdf (pip install pypdf); without it
+only the benchmark runs.
+"""
+import argparse
+import io
+import random
+import statistics
+import time
+
+from payslip_generator import get_generator, RENDERERS
+
+SAMPLE_EMPLOYEE = {
+    "id": 1, "emp_code": "EMP0001", "name": "Asha Kulkarni", "designation": "Senior Chemist",
+    "department": "Quality", "pan": "ABCDE1234F", "status": "Active",
+    "basic": 45000.0, "hra": 18000.0, "LTA": 2500.0, "special_allowance": 7350.5, "income_tax": 6120.0,
+}
+
+
+def synthetic_employee(i: int, rng: random.Random) -> dict:
+    emp = dict(SAMPLE_EMPLOYEE)
+    emp.update(id=i, emp_code=f"EMP{i:05d}", name=f"Employee {i}",
+               basic=round(rng.uniform(15000, 150000), 2), hra=round(rng.uniform(5000, 60000), 2),
+               special_allowance=round(rng.uniform(0, 20000), 2), income_tax=round(rng.uniform(0, 30000), 2))
+    return emp
+
+
+def extract_text_positions(pdf_bytes: bytes):
+    """Return sorted (text, x, y) for every non-empty text run on the first page."""
+    from pypdf import PdfReader
+
+    runs = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        text = text.strip()
+        if text:
+            # Text origin in page space: tm translated by the current matrix
+            x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+            y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+            runs.append((text, round(x, 1), round(y, 1)))
+
+    PdfReader(io.BytesIO(pdf_bytes)).pages[0].extract_text(visitor_text=visit)
+    return sorted(runs)
+
+
+def compare(emp: dict, pay_period: str, tolerance: float = 3.0) -> list:
+    """Return a list of differences between the two renderers' text and positions."""
+    gen = get_generator()
+    platypus = extract_text_positions(gen.render_pdf_bytes(emp, pay_period, "platypus"))
+    canvas = extract_text_positions(gen.render_pdf_bytes(emp, pay_period, "canvas"))
+
+    problems = []
+    platypus_texts = [t for t, _, _ in platypus]
+    canvas_texts = [t for t, _, _ in canvas]
+    if platypus_texts != canvas_texts:
+        missing = set(platypus_texts) - set(canvas_texts)
+        extra = set(canvas_texts) - set(platypus_texts)
+        problems.append(f"text differs: missing={sorted(missing)} extra={sorted(extra)}")
+        return problems
+    for (text, x1, y1), (_, x2, y2) in zip(platypus, canvas):
+        if abs(x1 - x2) > tolerance or abs(y1 - y2) > tolerance:
+            problems.append(f"{text!r}: platypus=({x1}, {y1}) canvas=({x2}, {y2})")
+    return problems
+
+
+def bench(payslips: int, pay_period: str, seed: int = 0) -> dict:
+    gen = get_generator()
+    rng = random.Random(seed)
+    employees = [synthetic_employee(i, rng) for i in range(1, payslips + 1)]
+    results = {}
+    for renderer in RENDERERS:
+        gen.render_pdf_bytes(employees[0], pay_period, renderer)  # warm-up
+        timings = []
+        for emp in employees:
+            start = time.perf_counter()
+            gen.render_pdf_bytes(emp, pay_period, renderer)
+            timings.append(time.perf_counter() - start)
+        results[renderer] = timings
+        print(f"{renderer:<9} mean {statistics.mean(timings) * 1000:7.2f} ms  "
+              f"median {statistics.median(timings) * 1000:7.2f} ms  "
+              f"{len(timings) / sum(timings):8.1f} payslips/s")
+    speedup = statistics.mean(results["platypus"]) / statistics.mean(results["canvas"])
+    print(f"canvas speedup: {speedup:.1f}x")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payslips", type=int, default=200)
+    parser.add_argument("--period", default="December 2025")
+    parser.add_argument("--tolerance", type=float, default=3.0, help="allowed position drift in points")
+    args = parser.parse_args(argv)
+
+    try:
+        problems = compare(SAMPLE_EMPLOYEE, args.period, args.tolerance)
+    except ImportError:
+        print("pypdf not installed; skipping text/position comparison")
+    else:
+        for problem in problems:
+            print("DIFF", problem)
+        print(f"comparison: {len(problems)} differences")
+        if problems:
+            raise SystemExit(1)
+
+    bench(args.payslips, args.period)
+
+
+if __name__ == "__main__":
+    main()
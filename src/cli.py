@@ -0,0 +1,229 @@
+# cli.py
+"""Headless payroll command line (no Qt): suitable for cron jobs and servers.
+
+    python cli.py import employees.csv
+    python cli.py export employees.csv --status Active
+    python cli.py run "December 2025" --out payslips/ --workers 8
+    python cli.py resume 12 --release
+    python cli.py jobs
+    python cli.py generate "December 2025" --out payslips/ --incremental
+    python cli.py stats
+    python cli.py bench payslips --sizes 100 1000
+
+Progress and results are printed to stdout as JSON lines (one object per
+line, each with an "event" key); logs go to stderr. Heavy modules (ReportLab,
+the job queue, benchmarks) are only imported by the commands that need them.
+"""
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+from db import ensure_db, upsert_employees, EMPLOYEE_COLUMNS
+from models import Employee
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DB_PATH = BASE_DIR / "data" / "employees.db"
+
+
+def emit(event: str, **fields) -> None:
+    print(json.dumps({"event": event, **fields}, default=str), flush=True)
+
+
+# ------------------- Employees -------------------
+def cmd_import(args) -> int:
+    with open(args.file, newline="", encoding="utf-8-sig") as f:
+        payloads = [Employee.from_dict(row).to_dict() for row in csv.DictReader(f)]
+    inserted, updated = upsert_employees(args.db, payloads)
+    emit("result", command="import", rows=len(payloads), inserted=inserted, updated=updated)
+    return 0
+
+
+def cmd_export(args) -> int:
+    from employee_store import get_store
+    rows = get_store(args.db).filter(department=args.department, status=args.status)
+    with open(args.file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["id", *EMPLOYEE_COLUMNS], extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    emit("result", command="export", rows=len(rows), file=str(args.file))
+    return 0
+
+
+def cmd_stats(args) -> int:
+    from db import compute_financials
+    from employee_store import get_store
+    store = get_store(args.db)
+    active = store.by_status("Active")
+    payroll = [compute_financials(e) for e in active]
+    emit("result", command="stats",
+         employees=store.count(),
+         active=len(active),
+         departments={d: len(store.by_department(d)) for d in store.departments()},
+         monthly_gross=round(sum(f["gross"] for f in payroll), 2),
+         monthly_net=round(sum(f["net"] for f in payroll), 2))
+    return 0
+
+
+# ------------------- Payroll runs -------------------
+def _emit_job_progress(status) -> None:
+    emit("progress", job_id=status.job_id, done=status.done, failed=status.failed,
+         pending=status.pending, running=status.running, total=status.total)
+
+
+def _emit_job_result(command: str, status) -> int:
+    emit("result", command=command, job_id=status.job_id, status=status.status,
+         done=status.done, failed=status.failed, open=status.pending + status.running)
+    return 0 if status.finished and not status.failed else 1
+
+
+def cmd_run(args) -> int:
+    from batch_payslips import select_employee_ids
+    from job_queue import create_job, run_job
+    ids = select_employee_ids(args.db, args.department, args.status)
+    job_id = create_job(args.db, args.period, args.out, ids, renderer=args.renderer,
+                        optimised=args.optimised, max_attempts=args.max_attempts)
+    emit("job_created", job_id=job_id, pay_period=args.period, tasks=len(ids))
+    status = run_job(args.db, job_id, workers=args.workers, on_progress=_emit_job_progress)
+    return _emit_job_result("run", status)
+
+
+def cmd_resume(args) -> int:
+    from job_queue import resume_job
+    status = resume_job(args.db, args.job_id, workers=args.workers, release=args.release,
+                        on_progress=_emit_job_progress)
+    return _emit_job_result("resume", status)
+
+
+def cmd_jobs(args) -> int:
+    from job_queue import list_jobs, job_status
+    for job in list_jobs(args.db):
+        status = job_status(args.db, job["id"])
+        emit("job", **job, done=status.done, failed=status.failed,
+             open=status.pending + status.running)
+    return 0
+
+
+def cmd_generate(args) -> int:
+    from batch_payslips import iter_batch, generate_consolidated
+    filters = dict(department=args.department, status=args.status)
+
+    if args.consolidated:
+        start = time.perf_counter()
+        path = generate_consolidated(args.db, args.period, args.consolidated,
+                                     optimised=args.optimised, **filters)
+        emit("result", command="generate", consolidated=path,
+             elapsed_s=round(time.perf_counter() - start, 3))
+        return 0
+
+    succeeded = failed = skipped = 0
+    elapsed = 0.0
+    for progress in iter_batch(args.db, args.period, args.out, workers=args.workers,
+                               incremental=args.incremental, renderer=args.renderer,
+                               optimised=args.optimised, **filters):
+        for r in progress.results:
+            if not r.ok:
+                failed += 1
+                emit("failed", employee_id=r.employee_id, error=r.error)
+            elif r.skipped:
+                skipped += 1
+            else:
+                succeeded += 1
+        elapsed = progress.elapsed
+        emit("progress", done=progress.done, total=progress.total, elapsed_s=round(elapsed, 3))
+    emit("result", command="generate", generated=succeeded, skipped=skipped, failed=failed,
+         elapsed_s=round(elapsed, 3), per_s=round(succeeded / elapsed, 2) if elapsed else 0.0)
+    return 1 if failed else 0
+
+
+def cmd_bench(args) -> int:
+    if args.suite == "payslips":
+        from bench_payslips import main as bench_main
+    elif args.suite == "renderers":
+        from bench_renderers import main as bench_main
+    else:
+        from bench_amount_words import main as bench_main
+    bench_main(args.bench_args)
+    return 0
+
+
+# ------------------- Entry point -------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, default=DB_PATH, help=f"database file (default: {DB_PATH})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress details to stderr")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_filters(p):
+        p.add_argument("--department")
+        p.add_argument("--status", default="Active", help="employee status filter ('' for all)")
+
+    def add_output(p):
+        p.add_argument("period", help='pay period, e.g. "December 2025"')
+        p.add_argument("--out", type=Path, default=BASE_DIR / "output", help="output directory")
+        p.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+        p.add_argument("--renderer", choices=("platypus", "canvas"), default="platypus")
+        p.add_argument("--optimised", action="store_true", help="smallest output files")
+        add_filters(p)
+
+    p = sub.add_parser("import", help="insert/update employees from a CSV file (matched on emp_code)")
+    p.add_argument("file", type=Path)
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("export", help="write employees to a CSV file")
+    p.add_argument("file", type=Path)
+    add_filters(p)
+    p.set_defaults(func=cmd_export, status=None)
+
+    p = sub.add_parser("stats", help="headcount and monthly payroll totals")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("run", help="payroll run as a resumable job")
+    add_output(p)
+    p.add_argument("--max-attempts", type=int, default=3)
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("resume", help="continue an interrupted job")
+    p.add_argument("job_id", type=int)
+    p.add_argument("--workers", type=int)
+    p.add_argument("--release", action="store_true",
+                   help="reclaim tasks leased by crashed workers now (no other worker may be running)")
+    p.set_defaults(func=cmd_resume)
+
+    p = sub.add_parser("jobs", help="list jobs and their progress")
+    p.set_defaults(func=cmd_jobs)
+
+    p = sub.add_parser("generate", help="batch payslip generation (no job record)")
+    add_output(p)
+    p.add_argument("--incremental", action="store_true", help="skip payslips that are up to date")
+    p.add_argument("--consolidated", type=Path, metavar="PDF", help="write one multi-page PDF instead")
+    p.set_defaults(func=cmd_generate)
+
+    p = sub.add_parser("bench", help="run a benchmark suite (remaining arguments go to it)")
+    p.add_argument("suite", choices=("payslips", "renderers", "amount-words"))
+    p.add_argument("bench_args", nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if getattr(args, "status", None) == "":
+        args.status = None
+    ensure_db(args.db)
+    try:
+        return args.func(args)
+    except Exception as e:
+        emit("error", command=args.command, error=str(e))
+        return 1
+
+
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,7 +1,7 @@
 # db.py
 import sqlite3
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Iterable, Tuple
 
 DEFAULT_SCHEMA = """
 CREATE TABLE IF NOT EXISTS employees (
@@ -33,6 +33,47 @@ CREATE TABLE IF NOT EXISTS payslips (
     notes TEXT,
     FOREIGN KEY(employee_id) REFERENCES employees(id)
 );
+
+-- One row per generated PDF: hash of the inputs it was built from + file checksum
+CREATE TABLE IF NOT EXISTS payslip_manifest (
+    output_path TEXT PRIMARY KEY,
+    employee_id INTEGER NOT NULL,
+    pay_period TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    pdf_sha256 TEXT NOT NULL,
+    template_version TEXT,
+    generated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Batch payroll runs (see job_queue.py): one job per run, one task per employee
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    pay_period TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    renderer TEXT DEFAULT 'platypus',
+    optimised INTEGER DEFAULT 0,
+    max_attempts INTEGER DEFAULT 3,
+    status TEXT DEFAULT 'pending',      -- pending, running, done, failed
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    finished_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS job_tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL,
+    employee_id INTEGER NOT NULL,
+    state TEXT DEFAULT 'pending',       -- pending, running, done, failed
+    attempts INTEGER DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,                 -- unix time
+    output_path TEXT,
+    error TEXT,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(job_id, employee_id),
+    FOREIGN KEY(job_id) REFERENCES jobs(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_tasks_state ON job_tasks(job_id, state);
 """
 
 # ------------------- Connection -------------------
@@ -57,6 +98,40 @@ def ensure_db(db_path: Path, seed_sample: bool = True) -> None:
 def row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
     return {k: row[k] for k in row.keys()} if row else {}
 
+# ------------------- Change notifications -------------------
+# Listeners are called as callback(db_key, action, emp_id, row) after every
+# committed employee write. action is "insert", "update" or "delete"; row is the
+# fresh employee dict (None for deletes). db_key identifies the database file.
+_change_listeners: List[Callable[[str, str, int, Optional[Dict[str, Any]]], None]] = []
+
+def add_change_listener(callback) -> None:
+    if callback not in _change_listeners:
+        _change_listeners.append(callback)
+
+def remove_change_listener(callback) -> None:
+    if callback in _change_listeners:
+        _change_listeners.remove(callback)
+
+def db_key(conn_or_path) -> str:
+    """Return a stable key for the database behind a path or connection."""
+    if isinstance(conn_or_path, (str, Path)):
+        return str(Path(conn_or_path).resolve())
+    for _, name, filename in conn_or_path.execute("PRAGMA database_list"):
+        if name == "main":
+            return str(Path(filename).resolve()) if filename else ":memory:"
+    return ":memory:"
+
+def _notify_change(conn: sqlite3.Connection, action: str, emp_id: int) -> None:
+    if not _change_listeners:
+        return
+    row = None
+    if action != "delete":
+        cur = conn.execute("SELECT * FROM employees WHERE id = ?", (emp_id,))
+        row = row_to_dict(cur.fetchone()) or None
+    key = db_key(conn)
+    for callback in list(_change_listeners):
+        callback(key, action, emp_id, row)
+
 # ------------------- Financials -------------------
 def compute_financials(emp_data: dict) -> dict:
     basic = float(emp_data.get("basic", 0.0) or 0.0)
@@ -100,6 +175,7 @@ def insert_employee(conn_or_path, payload: Dict[str, Any]) -> int:
     cur.execute(sql, payload)
     conn.commit()
     rowid = cur.lastrowid
+    _notify_change(conn, "insert", rowid)
     if close_conn:
         conn.close()
     return rowid
@@ -135,10 +211,67 @@ def update_employee(conn_or_path, emp_id: int, payload: Dict[str, Any]) -> bool:
     cur.execute(sql, params)
     conn.commit()
     changed = cur.rowcount > 0
+    if changed:
+        _notify_change(conn, "update", emp_id)
     if close_conn:
         conn.close()
     return changed
 
+EMPLOYEE_COLUMNS = (
+    "emp_code", "name", "designation", "department", "bank_account", "ifsc", "pan",
+    "joining_date", "notes", "basic", "hra", "LTA", "special_allowance", "income_tax", "status"
+)
+
+def upsert_employees(conn_or_path, payloads: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+    """Insert or update (matched on emp_code) many employees in a single transaction.
+
+    Returns (inserted, updated).
+    """
+    close_conn = False
+    if isinstance(conn_or_path, (str, Path)):
+        conn = get_conn(Path(conn_or_path))
+        close_conn = True
+    else:
+        conn = conn_or_path
+
+    insert_sql = f"""
+    INSERT INTO employees ({', '.join(EMPLOYEE_COLUMNS)})
+    VALUES ({', '.join(':' + c for c in EMPLOYEE_COLUMNS)})
+    """
+    update_sql = f"""
+    UPDATE employees SET {', '.join(f'{c} = :{c}' for c in EMPLOYEE_COLUMNS)} WHERE id = :id
+    """
+    cur = conn.cursor()
+    existing = {r["emp_code"]: r["id"] for r in cur.execute(
+        "SELECT id, emp_code FROM employees WHERE emp_code IS NOT NULL AND emp_code != ''")}
+    changes = []
+    try:
+        for payload in payloads:
+            params = {c: payload.get(c) for c in EMPLOYEE_COLUMNS}
+            params["emp_code"] = params["emp_code"] or None  # blank codes must not collide on UNIQUE
+            emp_id = existing.get(params["emp_code"])
+            if emp_id is not None:
+                cur.execute(update_sql, {**params, "id": emp_id})
+                changes.append(("update", emp_id))
+            else:
+                cur.execute(insert_sql, params)
+                if params["emp_code"]:
+                    existing[params["emp_code"]] = cur.lastrowid
+                changes.append(("insert", cur.lastrowid))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        if close_conn:
+            conn.close()
+        raise
+
+    for action, emp_id in changes:
+        _notify_change(conn, action, emp_id)
+    if close_conn:
+        conn.close()
+    inserted = sum(1 for action, _ in changes if action == "insert")
+    return inserted, len(changes) - inserted
+
 def delete_employee(conn_or_path, emp_id: int) -> bool:
     close_conn = False
     if isinstance(conn_or_path, (str, Path)):
@@ -151,6 +284,8 @@ def delete_employee(conn_or_path, emp_id: int) -> bool:
     cur.execute("DELETE FROM employees WHERE id = ?", (emp_id,))
     conn.commit()
     changed = cur.rowcount > 0
+    if changed:
+        _notify_change(conn, "delete", emp_id)
     if close_conn:
         conn.close()
     return changed
@@ -268,3 +403,41 @@ def get_payslip(conn_or_path, employee_id: int, pay_period: str) -> Optional[Dic
     if close_conn:
         conn.close()
     return res
+
+# ------------------- Payslip manifest -------------------
+def get_manifest_entry(conn_or_path, output_path: str) -> Optional[Dict[str, Any]]:
+    close_conn = False
+    if isinstance(conn_or_path, (str, Path)):
+        conn = get_conn(Path(conn_or_path))
+        close_conn = True
+    else:
+        conn = conn_or_path
+
+    cur = conn.cursor()
+    cur.execute("SELECT * FROM payslip_manifest WHERE output_path = ?", (output_path,))
+    row = cur.fetchone()
+    res = row_to_dict(row) if row else None
+    if close_conn:
+        conn.close()
+    return res
+
+def upsert_manifest_entry(conn_or_path, payload: Dict[str, Any]) -> None:
+    """Record (or replace) the manifest row for payload['output_path']."""
+    close_conn = False
+    if isinstance(conn_or_path, (str, Path)):
+        conn = get_conn(Path(conn_or_path))
+        close_conn = True
+    else:
+        conn = conn_or_path
+
+    sql = """
+    INSERT OR REPLACE INTO payslip_manifest
+    (output_path, employee_id, pay_period, input_hash, pdf_sha256, template_version, generated_at)
+    VALUES
+    (:output_path, :employee_id, :pay_period, :input_hash, :pdf_sha256, :template_version, CURRENT_TIMESTAMP)
+    """
+    cur = conn.cursor()
+    cur.execute(sql, payload)
+    conn.commit()
+    if close_conn:
+        conn.close()
@@ -0,0 +1,53 @@
+# employee_list_model.py
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+PLACEHOLDER = "-- Select Employee --"
+
+
+def picker_text(emp: Dict[str, Any]) -> str:
+    status_indicator = "🟢" if str(emp.get("status") or "").lower() == "active" else "🔴"
+    return f"{status_indicator} {emp.get('emp_code', emp.get('id', ''))} - {emp.get('name', '')}"
+
+
+class EmployeeListModel(QAbstractListModel):
+    """(id, display text) pairs for the payslip employee picker.
+
+    Row 0 is the "-- Select Employee --" placeholder (id None). Full records
+    are not kept here; look them up by id (UserRole) when one is selected.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Tuple[Optional[int], str]] = [(None, PLACEHOLDER)]
+
+    def set_employees(self, rows: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._items = [(None, PLACEHOLDER)]
+        self._items.extend((emp["id"], picker_text(emp)) for emp in rows)
+        self.endResetModel()
+
+    def employee_id(self, row: int) -> Optional[int]:
+        return self._items[row][0] if 0 <= row < len(self._items) else None
+
+    def row_of(self, emp_id: Optional[int]) -> int:
+        """Row showing emp_id, or 0 (the placeholder) if it is not listed."""
+        if emp_id is not None:
+            for row, (item_id, _) in enumerate(self._items):
+                if item_id == emp_id:
+                    return row
+        return 0
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        emp_id, text = self._items[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return text
+        if role == Qt.ItemDataRole.UserRole:
+            return emp_id
+        return None
@@ -0,0 +1,234 @@
+# employee_store.py
+import threading
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Callable
+
+from db import (get_all_employees, get_employee_by_id, insert_employee, update_employee, delete_employee,
+                add_change_listener, db_key)
+
+
+def _name_key(emp: Dict[str, Any]):
+    return ((emp.get("name") or "").lower(), emp["id"])
+
+
+def _status_key(status) -> str:
+    return (status or "").strip().lower()
+
+
+class EmployeeStore:
+    """In-memory copy of the employees table with secondary indexes.
+
+    Loaded once from SQLite and kept coherent through the db.py change
+    notifications, so lookups and filters never go back to the database.
+    Indexes: id, emp_code, department, status (lower-cased) and a sorted
+    (lower-cased name, id) list that preserves the get_all_employees order.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.version = 0
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._by_code: Dict[str, int] = {}
+        self._by_department: Dict[str, set] = {}
+        self._by_status: Dict[str, set] = {}
+        self._name_index: List[tuple] = []
+        self._row_versions: Dict[int, int] = {}
+        self._listeners: List[Callable] = []
+
+    # ------------------- Change events -------------------
+    def add_listener(self, callback) -> None:
+        """Call callback(action, emp_id, row, old_row) after every single-row change."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # ------------------- Loading -------------------
+    def load(self) -> None:
+        """(Re)load every employee from SQLite and rebuild the indexes."""
+        rows = get_all_employees(self.db_path)
+        with self._lock:
+            self._by_id.clear()
+            self._by_code.clear()
+            self._by_department.clear()
+            self._by_status.clear()
+            self._name_index = []
+            for emp in rows:
+                self._index(emp)
+            self._name_index.sort()
+            self._loaded = True
+            self.version += 1
+
+    def ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    # ------------------- Index maintenance -------------------
+    def _index(self, emp: Dict[str, Any], keep_sorted: bool = False) -> None:
+        emp_id = emp["id"]
+        self._by_id[emp_id] = emp
+        if emp.get("emp_code"):
+            self._by_code[emp["emp_code"]] = emp_id
+        self._by_department.setdefault(emp.get("department") or "", set()).add(emp_id)
+        self._by_status.setdefault(_status_key(emp.get("status")), set()).add(emp_id)
+        if keep_sorted:
+            insort(self._name_index, _name_key(emp))
+        else:
+            self._name_index.append(_name_key(emp))
+        self._row_versions[emp_id] = self._row_versions.get(emp_id, 0) + 1
+
+    def _unindex(self, emp_id: int) -> None:
+        emp = self._by_id.pop(emp_id, None)
+        if emp is None:
+            return
+        if emp.get("emp_code") and self._by_code.get(emp["emp_code"]) == emp_id:
+            del self._by_code[emp["emp_code"]]
+        for index, key in ((self._by_department, emp.get("department") or ""),
+                           (self._by_status, _status_key(emp.get("status")))):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(emp_id)
+                if not ids:
+                    del index[key]
+        key = _name_key(emp)
+        pos = bisect_left(self._name_index, key)
+        if pos < len(self._name_index) and self._name_index[pos] == key:
+            del self._name_index[pos]
+
+    def apply_change(self, action: str, emp_id: int, row: Optional[Dict[str, Any]]) -> None:
+        """Apply a single-row change coming from a db.py write function."""
+        with self._lock:
+            if not self._loaded:
+                return
+            old_row = self._by_id.get(emp_id)
+            self._unindex(emp_id)
+            if action == "delete" or row is None:
+                self._row_versions.pop(emp_id, None)
+                row = None
+            else:
+                self._index(row, keep_sorted=True)
+            self.version += 1
+        for callback in list(self._listeners):
+            callback(action, emp_id, row, old_row)
+
+    # ------------------- Writes -------------------
+    # Each goes through db.py (whose change notification updates the store and
+    # fires the change event) and returns the affected row.
+    def insert(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        emp_id = insert_employee(self.db_path, payload)
+        return self._written("insert", emp_id)
+
+    def update(self, emp_id: int, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Returns the updated row, or None if no such employee."""
+        if not update_employee(self.db_path, emp_id, payload):
+            return None
+        return self._written("update", emp_id)
+
+    def delete(self, emp_id: int) -> Optional[Dict[str, Any]]:
+        """Returns the deleted row, or None if no such employee."""
+        old_row = self.get(emp_id)
+        if not delete_employee(self.db_path, emp_id):
+            return None
+        if _stores.get(db_key(self.db_path)) is not self:
+            self.apply_change("delete", emp_id, None)
+        return old_row
+
+    def _written(self, action: str, emp_id: int) -> Optional[Dict[str, Any]]:
+        if _stores.get(db_key(self.db_path)) is not self:
+            # Not the shared store, so db.py notifications don't reach it
+            self.apply_change(action, emp_id, get_employee_by_id(self.db_path, emp_id))
+        return self.get(emp_id)
+
+    # ------------------- Queries -------------------
+    def _rows(self, ids) -> List[Dict[str, Any]]:
+        """Return rows for ids in name order."""
+        if len(ids) == len(self._by_id):
+            return [self._by_id[i] for _, i in self._name_index]
+        return [self._by_id[i] for _, i in self._name_index if i in ids]
+
+    def all(self) -> List[Dict[str, Any]]:
+        self.ensure_loaded()
+        with self._lock:
+            return [self._by_id[i] for _, i in self._name_index]
+
+    def get(self, emp_id: int) -> Optional[Dict[str, Any]]:
+        self.ensure_loaded()
+        return self._by_id.get(emp_id)
+
+    def get_by_code(self, emp_code: str) -> Optional[Dict[str, Any]]:
+        self.ensure_loaded()
+        emp_id = self._by_code.get(emp_code)
+        return self._by_id.get(emp_id) if emp_id is not None else None
+
+    def row_version(self, emp_id: int) -> int:
+        return self._row_versions.get(emp_id, 0)
+
+    def by_department(self, department: str) -> List[Dict[str, Any]]:
+        self.ensure_loaded()
+        with self._lock:
+            return self._rows(self._by_department.get(department or "", set()))
+
+    def by_status(self, status: str) -> List[Dict[str, Any]]:
+        self.ensure_loaded()
+        with self._lock:
+            return self._rows(self._by_status.get(_status_key(status), set()))
+
+    def departments(self) -> List[str]:
+        self.ensure_loaded()
+        with self._lock:
+            return sorted(d for d in self._by_department if d)
+
+    def count(self, status: Optional[str] = None) -> int:
+        self.ensure_loaded()
+        if status is None:
+            return len(self._by_id)
+        return len(self._by_status.get(_status_key(status), ()))
+
+    def filter(self, search: str = "", department: Optional[str] = None,
+               status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Filter by department/status via the indexes, then by search text."""
+        self.ensure_loaded()
+        with self._lock:
+            ids = None
+            if department:
+                ids = self._by_department.get(department, set())
+            if status:
+                status_ids = self._by_status.get(_status_key(status), set())
+                ids = status_ids if ids is None else ids & status_ids
+            rows = self._rows(ids) if ids is not None else self.all()
+
+        search = search.lower()
+        if not search:
+            return rows
+        return [
+            emp for emp in rows
+            if search in f"{emp.get('name', '')} {emp.get('emp_code', '')} {emp.get('designation', '')}".lower()
+        ]
+
+
+# ------------------- Process-wide stores -------------------
+_stores: Dict[str, EmployeeStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _on_db_change(key: str, action: str, emp_id: int, row) -> None:
+    store = _stores.get(key)
+    if store is not None:
+        store.apply_change(action, emp_id, row)
+
+
+def get_store(db_path) -> EmployeeStore:
+    """Return the shared EmployeeStore for db_path, creating it on first use."""
+    key = db_key(db_path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = EmployeeStore(db_path)
+            _stores[key] = store
+            add_change_listener(_on_db_change)
+        return store
@@ -0,0 +1,282 @@
+# employee_table_model.py
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtGui import QColor, QFont
+
+from db import compute_financials
+
+COLUMNS = ["ID", "Code", "Name", "Designation", "Department", "Gross Pay", "Net Pay", "Status"]
+COL_ID, COL_CODE, COL_NAME, COL_DESIGNATION, COL_DEPARTMENT, COL_GROSS, COL_NET, COL_STATUS = range(len(COLUMNS))
+
+FETCH_BATCH = 200
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1  # raw value (numbers for pay columns) used for sorting
+
+
+def _order_key(emp: Dict[str, Any]):
+    return ((emp.get("name") or "").lower(), emp["id"])
+
+
+_CENTER = Qt.AlignmentFlag.AlignCenter
+_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class EmployeeTableModel(QAbstractTableModel):
+    """Employee rows for a QTableView.
+
+    Cells are formatted in data() only when the view asks for them (visible
+    rows), gross/net are computed once per row on first use, and rows are
+    exposed to the view in batches through canFetchMore/fetchMore. Sorting
+    and filtering are done by EmployeeFilterProxy on top.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._fetched = 0
+        self._financials: Dict[int, Dict[str, float]] = {}
+        self._search_keys: Dict[int, str] = {}
+        self._name_font = None
+        self._net_font = None
+
+    # ------------------- Data -------------------
+    def set_employees(self, rows: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._fetched = min(FETCH_BATCH, len(self._rows))
+        self._financials.clear()
+        self._search_keys.clear()
+        self.endResetModel()
+
+    def employee(self, row: int) -> Optional[Dict[str, Any]]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def employees(self) -> List[Dict[str, Any]]:
+        return self._rows
+
+    def financials(self, emp: Dict[str, Any]) -> Dict[str, float]:
+        fin = self._financials.get(emp["id"])
+        if fin is None:
+            fin = self._financials[emp["id"]] = compute_financials(emp)
+        return fin
+
+    def search_key(self, emp: Dict[str, Any]) -> str:
+        """Lower-cased text the search box matches against (name, code, designation)."""
+        key = self._search_keys.get(emp["id"])
+        if key is None:
+            key = self._search_keys[emp["id"]] = " ".join(
+                str(emp.get(f) or "").lower() for f in ("name", "emp_code", "designation"))
+        return key
+
+    # ------------------- Single-row changes -------------------
+    def forget(self, emp_id: int) -> None:
+        """Drop cached values derived from a row that is about to change."""
+        self._financials.pop(emp_id, None)
+        self._search_keys.pop(emp_id, None)
+
+    def _row_of(self, emp: Dict[str, Any]) -> int:
+        """Row currently holding emp (found by its sort key), or -1."""
+        pos = self._insert_position(emp)
+        if pos < len(self._rows) and self._rows[pos]["id"] == emp["id"]:
+            return pos
+        return -1
+
+    def _insert_position(self, emp: Dict[str, Any]) -> int:
+        """Binary search for emp's place in the (lower-cased name, id) order the store uses."""
+        key = _order_key(emp)
+        lo, hi = 0, len(self._rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _order_key(self._rows[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def apply_change(self, action: str, emp_id: int, row: Optional[Dict[str, Any]],
+                     old: Optional[Dict[str, Any]] = None) -> None:
+        """Insert, replace or remove one row in place (see EmployeeStore change events).
+
+        old is the row as it was before the change; both it and row are located
+        by binary search on the (name, id) order.
+        """
+        self.forget(emp_id)
+        pos = self._row_of(old) if old is not None else -1
+        if pos >= 0 and row is not None and _order_key(self._rows[pos]) == _order_key(row):
+            self._rows[pos] = row  # same place: just repaint the row
+            if pos < self._fetched:
+                self.dataChanged.emit(self.index(pos, 0), self.index(pos, len(COLUMNS) - 1))
+            return
+        if pos >= 0:
+            if pos < self._fetched:
+                self.beginRemoveRows(QModelIndex(), pos, pos)
+                del self._rows[pos]
+                self._fetched -= 1
+                self.endRemoveRows()
+            else:
+                del self._rows[pos]
+        if row is not None:
+            pos = self._insert_position(row)
+            if pos < self._fetched or self._fetched == len(self._rows):
+                self.beginInsertRows(QModelIndex(), pos, pos)
+                self._rows.insert(pos, row)
+                self._fetched += 1
+                self.endInsertRows()
+            else:
+                self._rows.insert(pos, row)  # beyond the fetched batches; shows up on fetchMore
+
+    # ------------------- Incremental fetch -------------------
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._fetched < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH, len(self._rows) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def fetch_all(self) -> None:
+        """Expose every row (needed before sorting or filtering the whole set)."""
+        if self._fetched < len(self._rows):
+            self.beginInsertRows(QModelIndex(), self._fetched, len(self._rows) - 1)
+            self._fetched = len(self._rows)
+            self.endInsertRows()
+
+    # ------------------- QAbstractTableModel -------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        emp = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == COL_ID:
+                return str(emp.get("id", ""))
+            if col == COL_CODE:
+                return emp.get("emp_code", "")
+            if col == COL_NAME:
+                return emp.get("name", "")
+            if col == COL_DESIGNATION:
+                return emp.get("designation", "")
+            if col == COL_DEPARTMENT:
+                return emp.get("department", "")
+            if col == COL_GROSS:
+                return f"₹{self.financials(emp)['gross']:,.2f}"
+            if col == COL_NET:
+                return f"₹{self.financials(emp)['net']:,.2f}"
+            if col == COL_STATUS:
+                return "🟢 Active" if str(emp.get("status", "Active")).lower() == "active" else "🔴 Inactive"
+        elif role == SORT_ROLE:
+            if col == COL_ID:
+                return emp.get("id") or 0
+            if col == COL_GROSS:
+                return float(self.financials(emp)["gross"])
+            if col == COL_NET:
+                return float(self.financials(emp)["net"])
+            return str(self.data(index, Qt.ItemDataRole.DisplayRole) or "").lower()
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if col in (COL_GROSS, COL_NET):
+                return _RIGHT
+            if col != COL_NAME:
+                return _CENTER
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if col == COL_GROSS:
+                return QColor("#059669")
+            if col == COL_NET:
+                return QColor("#3b82f6")
+        elif role == Qt.ItemDataRole.FontRole:
+            if col == COL_NAME:
+                if self._name_font is None:
+                    self._name_font = QFont("", 0, QFont.Weight.DemiBold)
+                return self._name_font
+            if col == COL_NET:
+                if self._net_font is None:
+                    self._net_font = QFont("", 0, QFont.Weight.Bold)
+                return self._net_font
+        return None
+
+
+class EmployeeFilterProxy(QSortFilterProxyModel):
+    """In-memory search/department/status filtering and numeric-aware sorting over EmployeeTableModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+        self._search = ""
+        self._search_ids = None  # ids matched by SearchPipeline; None = no search
+        self._department = None
+        self._status = None
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelReset.connect(self._on_source_reset)
+
+    def _on_source_reset(self):
+        # A reset exposes only the first batch again; sorting/filtering need them all
+        if self.sortColumn() >= 0 or self.is_filtered():
+            self.sourceModel().fetch_all()
+
+    def set_filters(self, search: str = "", department: Optional[str] = None,
+                    status: Optional[str] = None) -> None:
+        search = (search or "").strip().lower()
+        status = status.lower() if status else None
+        if (search, department, status) == (self._search, self._department, self._status):
+            return
+        self._search, self._department, self._status = search, department, status
+        if self.is_filtered():
+            self.sourceModel().fetch_all()  # a filter must see every row, not just the fetched batches
+        self.invalidateFilter()
+
+    def set_search_ids(self, ids) -> None:
+        """Restrict rows to ids (a set from SearchPipeline), or None to lift the restriction."""
+        self._search_ids = ids
+        if ids is not None:
+            self.sourceModel().fetch_all()
+        self.invalidateFilter()
+
+    def update_search_ids(self, ids) -> None:
+        """Replace the search id set after a single-row change, without re-filtering every row."""
+        self._search_ids = ids
+
+    def is_filtered(self) -> bool:
+        return bool(self._search or self._search_ids is not None or self._department or self._status)
+
+    def accepts(self, emp: Dict[str, Any]) -> bool:
+        if self._department and emp.get("department") != self._department:
+            return False
+        if self._status and str(emp.get("status") or "").lower() != self._status:
+            return False
+        if self._search_ids is not None and emp["id"] not in self._search_ids:
+            return False
+        return not self._search or self._search in self.sourceModel().search_key(emp)
+
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        return self.accepts(self.sourceModel().employee(source_row))
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column >= 0:
+            self.sourceModel().fetch_all()
+        super().sort(column, order)
+
+    def employee(self, row: int) -> Optional[Dict[str, Any]]:
+        source = self.mapToSource(self.index(row, 0))
+        return self.sourceModel().employee(source.row()) if source.isValid() else None
+
+    def visible_employees(self) -> List[Dict[str, Any]]:
+        """All rows passing the filter (including ones not fetched into the view yet)."""
+        return [e for e in self.sourceModel().employees() if self.accepts(e)]
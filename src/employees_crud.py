@@ -1,48 +1,41 @@
 # employees_crud.py
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
     QMessageBox, QDialog, QLabel, QLineEdit, QFormLayout, QDialogButtonBox, QSpinBox,
     QDoubleSpinBox, QComboBox, QHeaderView, QAbstractItemView, QFrame, QGridLayout,
     QScrollArea, QTextEdit, QDateEdit, QCheckBox
 )
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+from collections import Counter
+
+from PyQt6.QtCore import Qt, QDate, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QColor, QPalette
-from db import (
-    get_conn,
-    get_all_employees,
-    get_active_employees,
-    get_departments,
-    compute_financials,
-    insert_employee,
-    update_employee,
-    delete_employee
-)
+from db import get_conn
+from employee_store import get_store
+from employee_table_model import EmployeeTableModel, EmployeeFilterProxy, FETCH_BATCH
+from search_pipeline import SearchPipeline
 
 from ModernEmployeeFormDialog import ModernEmployeeFormDialog
 
 from models import Employee
 from ui_helpers import ModernCard, GlassButton, ModernInput, StatsCard, ModernLabel, ActionButton
 
+
 class ModernEmployeesWidget(QWidget):
     def __init__(self, db_path, parent=None):
         super().__init__(parent)
         self.db_path = db_path
+        self.store = get_store(db_path)
+        self.loaded = False
+        # Running totals behind the stats cards, so single-row changes can adjust them
+        self.stats_count = 0
+        self.stats_payroll = 0.0
+        self.stats_departments = Counter()
         self.init_ui()
+        # The store outlives this page: unsubscribe when the widget is destroyed
+        callback, store = self.on_store_change, self.store
+        store.add_listener(callback)
+        self.destroyed.connect(lambda *_: store.remove_listener(callback))
 
-    def load_stats(self):
-        # Total employees (all)
-        all_emps = get_all_employees(self.db_path)
-        total_employees = len(all_emps)
-
-        # Total payroll (sum of net pay for active employees)
-        active_emps = get_active_employees(self.db_path)
-        total_payroll = sum(compute_financials(emp)["net"] for emp in active_emps)
-
-        # Total unique departments
-        departments = get_departments(self.db_path)
-        total_departments = len(departments)
-
-        return total_employees, total_payroll, total_departments
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
@@ -53,19 +46,16 @@ class ModernEmployeesWidget(QWidget):
         stats_layout.setSpacing(20)
 
         # We'll update these with real data
-        self.total_employees_card = StatsCard("Total Employees", "0", "Active", "👥", "#3b82f6")
-        self.total_salary_card = StatsCard("Total Payroll", "₹0", "Per Month", "💰", "#059669")
-        self.departments_card = StatsCard("Departments", "0", "Active", "🏢", "#7c3aed")
+        self.total_employees_card = StatsCard("Total Employees", "0", "Active", "👥", "blue")
+        self.total_salary_card = StatsCard("Total Payroll", "₹0", "Per Month", "💰", "green")
+        self.departments_card = StatsCard("Departments", "0", "Active", "🏢", "purple")
 
         stats_layout.addWidget(self.total_employees_card)
         stats_layout.addWidget(self.total_salary_card)
         stats_layout.addWidget(self.departments_card)
 
         layout.addLayout(stats_layout)
-        total_employees, total_payroll, total_departments = self.load_stats()
-        self.total_employees_card.update_value(str(total_employees))
-        self.total_salary_card.update_value(f"₹{total_payroll:,.2f}")
-        self.departments_card.update_value(str(total_departments))
+
         # Main content card
         main_card = ModernCard("Employee Directory")
         main_layout = QVBoxLayout()
@@ -76,34 +66,31 @@ class ModernEmployeesWidget(QWidget):
 
         # Search input
         self.search_input = ModernInput("🔍 Search employees...")
-        self.search_input.textChanged.connect(self.filter_employees)
+        self.search_pipeline = SearchPipeline(self)
+        self.search_pipeline.results_ready.connect(self.on_search_results)
+        self.search_input.textChanged.connect(self.search_pipeline.submit)
         search_layout.addWidget(self.search_input, 2)
 
         # Department filter
         dept_label = QLabel("Department:")
-        dept_label.setStyleSheet("font-weight: 500; color: #374151;")
+        dept_label.setObjectName("filterLabel")
         search_layout.addWidget(dept_label)
 
         self.dept_filter = QComboBox()
+        self.dept_filter.setObjectName("filterCombo")
         self.dept_filter.setMinimumHeight(44)
-        self.dept_filter.setStyleSheet("""
-            QComboBox {
-                background: white;
-                border: 2px solid #e5e7eb;
-                border-radius: 12px;
-                padding: 8px 16px;
-                font-size: 14px;
-                color: #374151;
-                min-width: 150px;
-            }
-            QComboBox:hover {
-                border-color: #3b82f6;
-            }
-        """)
         self.dept_filter.addItem("All Departments")
         self.dept_filter.currentTextChanged.connect(self.filter_employees)
         search_layout.addWidget(self.dept_filter)
 
+        # Status filter
+        self.status_filter = QComboBox()
+        self.status_filter.setObjectName("filterCombo")
+        self.status_filter.setMinimumHeight(44)
+        self.status_filter.addItems(["All Statuses", "Active", "Inactive"])
+        self.status_filter.currentTextChanged.connect(self.filter_employees)
+        search_layout.addWidget(self.status_filter)
+
         # Action buttons
         add_btn = GlassButton("➕ Add Employee", primary=True)
         add_btn.clicked.connect(self.on_add)
@@ -111,8 +98,13 @@ class ModernEmployeesWidget(QWidget):
 
         main_layout.addLayout(search_layout)
 
-        # Employee table
-        self.table = QTableWidget()
+        # Employee table (model/view: cells are produced on demand for visible rows;
+        # the proxy filters and sorts in memory)
+        self.table_model = EmployeeTableModel(self)
+        self.proxy_model = EmployeeFilterProxy(self)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
         self.setup_table()
         main_layout.addWidget(self.table)
 
@@ -130,7 +122,7 @@ class ModernEmployeesWidget(QWidget):
         table_actions.addStretch()
 
         refresh_btn = GlassButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self.refresh_data)
+        refresh_btn.clicked.connect(self.reload_data)
         table_actions.addWidget(refresh_btn)
 
         main_layout.addLayout(table_actions)
@@ -138,47 +130,23 @@ class ModernEmployeesWidget(QWidget):
         main_card.set_content_layout(main_layout)
         layout.addWidget(main_card)
 
-        # Load initial data
-        self.refresh_data()
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Initial data load waits until the page is on screen (and painted once)
+        if not self.loaded:
+            self.loaded = True
+            QTimer.singleShot(0, self.refresh_data)
 
     def setup_table(self):
-        headers = ["ID", "Code", "Name", "Designation", "Department", "Gross Pay", "Net Pay", "Status"]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-
-        # Table styling
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #e5e7eb;
-                border-radius: 12px;
-                gridline-color: #f3f4f6;
-                selection-background-color: rgba(59, 130, 246, 0.1);
-                alternate-background-color: #f9fafb;
-            }
-            QHeaderView::section {
-                background-color: #f8fafc;
-                color: #374151;
-                font-weight: 600;
-                font-size: 13px;
-                border: none;
-                border-bottom: 2px solid #e5e7eb;
-                padding: 12px 8px;
-            }
-            QTableWidget::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #f3f4f6;
-            }
-            QTableWidget::item:selected {
-                background-color: rgba(59, 130, 246, 0.1);
-                color: #1e293b;
-            }
-        """)
+        # Table styling (QTableView#employeeTable in styles/style.qss)
+        self.table.setObjectName("employeeTable")
 
         # Table behavior
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setAlternatingRowColors(True)
+        # Start unsorted (store order is by name) so only the first batch is exposed
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table.setSortingEnabled(True)
 
         # **Make table read-only**
@@ -194,31 +162,51 @@ class ModernEmployeesWidget(QWidget):
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Gross
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)  # Net
         header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)  # Status
+        header.setResizeContentsPrecision(FETCH_BATCH)  # size columns from one batch, not every row
 
     def get_all_employees(self):
-        return get_all_employees(self.db_path)
+        return self.store.all()
+
+    def reload_data(self):
+        """Re-read SQLite (picks up changes made by other processes) and refresh."""
+        self.store.load()
+        self.refresh_data()
 
     def refresh_data(self):
         employees = self.get_all_employees()
-        self.update_stats(employees)
-        self.update_table(employees)
         self.update_department_filter(employees)
+        self.update_table(employees)
+        self.update_stats(self.proxy_model.visible_employees())
 
     def update_stats(self, employees):
         # Total count (all employees in current filter)
-        total_count = len(employees)
+        self.stats_count = len(employees)
 
         # Total payroll (sum of net pay for active employees in current filter)
         active_employees = [emp for emp in employees if emp.get("status", "").lower() == "active"]
-        total_payroll = sum(compute_financials(emp)["net"] for emp in active_employees)
+        self.stats_payroll = sum(self.table_model.financials(emp)["net"] for emp in active_employees)
+
+        # Departments in current filter (with counts, so a removed row can drop its department)
+        self.stats_departments = Counter(emp['department'] for emp in employees if emp.get('department'))
+
+        self.show_stats()
 
-        # Unique departments in current filter
-        departments = set(emp.get('department', '') for emp in employees if emp.get('department'))
+    def adjust_stats(self, emp, sign, financials=None):
+        """Add (sign=1) or remove (sign=-1) one visible employee from the running totals."""
+        self.stats_count += sign
+        if str(emp.get("status") or "").lower() == "active":
+            fin = financials or self.table_model.financials(emp)
+            self.stats_payroll += sign * fin["net"]
+        if emp.get("department"):
+            self.stats_departments[emp["department"]] += sign
+            if self.stats_departments[emp["department"]] <= 0:
+                del self.stats_departments[emp["department"]]
 
+    def show_stats(self):
         # Update cards
-        self.total_employees_card.update_value(str(total_count))
-        self.total_salary_card.update_value(f"₹{total_payroll:,.2f}")
-        self.departments_card.update_value(str(len(departments)))
+        self.total_employees_card.update_value(str(self.stats_count))
+        self.total_salary_card.update_value(f"₹{self.stats_payroll:,.2f}")
+        self.departments_card.update_value(str(len(self.stats_departments)))
 
         # Update card titles to reflect current filter
         dept_filter = self.dept_filter.currentText()
@@ -237,162 +225,127 @@ class ModernEmployeesWidget(QWidget):
 
     def update_department_filter(self, employees):
         current_selection = self.dept_filter.currentText()
+        self.dept_filter.blockSignals(True)  # filters are applied once, by the caller
         self.dept_filter.clear()
         self.dept_filter.addItem("All Departments")
 
-        departments = set(emp.get('department', '') for emp in employees if emp.get('department'))
-        for dept in sorted(departments):
+        for dept in self.store.departments():
             self.dept_filter.addItem(dept)
 
         # Restore selection if possible
         index = self.dept_filter.findText(current_selection)
         if index >= 0:
             self.dept_filter.setCurrentIndex(index)
+        self.dept_filter.blockSignals(False)
 
-    def update_table(self, employees):
-        """
-        Populate the QTableWidget using compute_financials(emp) so Gross/Net are correct.
-        """
-        self.table.setRowCount(len(employees))
-
-        for i, emp in enumerate(employees):
-            # Ensure we use compute_financials to get gross/net
-            financials = compute_financials(emp)
-            gross_pay = financials.get("gross", 0.0)
-            net_pay = financials.get("net", 0.0)
-
-            # --- ID ---
-            id_item = QTableWidgetItem(str(emp.get("id", "")))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, id_item)
-
-            # --- Code ---
-            code_item = QTableWidgetItem(emp.get("emp_code", ""))
-            code_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 1, code_item)
-
-            # --- Name ---
-            name_item = QTableWidgetItem(emp.get("name", ""))
-            name_item.setFont(QFont("", 0, QFont.Weight.DemiBold))
-            # keep default alignment (left) for name for better readability
-            self.table.setItem(i, 2, name_item)
-
-            # --- Designation ---
-            des_item = QTableWidgetItem(emp.get("designation", ""))
-            des_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 3, des_item)
-
-            # --- Department ---
-            dept_item = QTableWidgetItem(emp.get("department", ""))
-            dept_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 4, dept_item)
-
-            # --- Gross Pay (formatted display, numeric value for sorting) ---
-            gross_text = f"₹{gross_pay:,.2f}"
-            gross_item = QTableWidgetItem(gross_text)
-            gross_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            gross_item.setForeground(QColor("#059669"))
-            # set numeric value so sorting treats it as number
-            gross_item.setData(Qt.ItemDataRole.UserRole, float(gross_pay))
-            self.table.setItem(i, 5, gross_item)
-
-            # --- Net Pay (formatted display, numeric value for sorting) ---
-            net_text = f"₹{net_pay:,.2f}"
-            net_item = QTableWidgetItem(net_text)
-            net_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            net_item.setForeground(QColor("#3b82f6"))
-            net_item.setFont(QFont("", 0, QFont.Weight.Bold))
-            net_item.setData(Qt.ItemDataRole.UserRole, float(net_pay))
-            self.table.setItem(i, 6, net_item)
-
-            # --- Status ---
-            status = emp.get("status", "Active")
-            status_text = "🟢 Active" if str(status).lower() == "active" else "🔴 Inactive"
-            status_item = QTableWidgetItem(status_text)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 7, status_item)
-
-        # If you want sorting by the numeric value to actually work, map the sort role:
-        # set a proxy so Qt will consider UserRole when sorting. QTableWidget doesn't expose
-        # a direct API for changing the sort role, so we use a small trick: reimplement
-        # lessThan in a QSortFilterProxyModel if you migrate to QTableView + model.
-        # For now, this keeps numeric values attached to items (useful later).
-
+    def add_department_option(self, department):
+        if not department or self.dept_filter.findText(department) >= 0:
+            return
+        pos = 1  # after "All Departments"
+        while pos < self.dept_filter.count() and self.dept_filter.itemText(pos) < department:
+            pos += 1
+        self.dept_filter.insertItem(pos, department)
+
+    def remove_department_option(self, department):
+        index = self.dept_filter.findText(department) if department else -1
+        if index <= 0 or department in self.store.departments():
+            return
+        was_current = index == self.dept_filter.currentIndex()
+        self.dept_filter.blockSignals(True)
+        self.dept_filter.removeItem(index)
+        if was_current:
+            self.dept_filter.setCurrentIndex(0)
+        self.dept_filter.blockSignals(False)
+        if was_current:
+            self.filter_employees()
 
+    def update_table(self, employees):
+        """Show employees in the table; the model formats only the rows the view displays."""
+        self.table_model.set_employees(employees)
+        self.search_pipeline.set_index(employees, self.table_model.search_key)
+        self.apply_filters()
 
-    def filter_employees(self):
-        search_text = self.search_input.text().lower()
+    def apply_filters(self):
         dept_filter = self.dept_filter.currentText()
+        status_filter = self.status_filter.currentText()
+        self.proxy_model.set_filters(
+            department=dept_filter if dept_filter != "All Departments" else None,
+            status=status_filter if status_filter != "All Statuses" else None,
+        )
 
-        employees = self.get_all_employees()
-
-        # Apply filters
-        filtered_employees = []
-        for emp in employees:
-            # Search filter
-            if search_text:
-                searchable = f"{emp.get('name', '')} {emp.get('emp_code', '')} {emp.get('designation', '')}".lower()
-                if search_text not in searchable:
-                    continue
-
-            # Department filter
-            if dept_filter != "All Departments":
-                if emp.get('department', '') != dept_filter:
-                    continue
-
-            filtered_employees.append(emp)
-
-        # Update table with filtered data
-        self.update_table(filtered_employees)
+    def filter_employees(self):
+        # Department/status filtering runs in the proxy over rows already in memory;
+        # search text goes through search_pipeline (debounced, off the UI thread)
+        self.apply_filters()
 
         # Update stats cards with filtered data
-        self.update_stats(filtered_employees)
+        self.update_stats(self.proxy_model.visible_employees())
 
-    def selected_employee_id(self):
-        selected_items = self.table.selectedItems()
-        if not selected_items:
+    def on_search_results(self, ids):
+        self.proxy_model.set_search_ids(ids)
+        self.update_stats(self.proxy_model.visible_employees())
+
+    def on_store_change(self, action, emp_id, row, old):
+        """Apply one added/edited/deleted employee to the table, stats and department filter."""
+        if not self.loaded:
+            return
+        old_visible = old is not None and self.proxy_model.accepts(old)
+        old_financials = self.table_model.financials(old) if old_visible else None
+        self.table_model.forget(emp_id)
+
+        self.search_pipeline.apply_change(emp_id, self.table_model.search_key(row) if row else None)
+        # The published set (not None) while a newer query is still running
+        self.proxy_model.update_search_ids(self.search_pipeline.current_ids())
+        self.table_model.apply_change(action, emp_id, row, old)
+
+        new_visible = row is not None and self.proxy_model.accepts(row)
+        if old_visible:
+            self.adjust_stats(old, -1, old_financials)
+        if new_visible:
+            self.adjust_stats(row, 1)
+        if old_visible or new_visible:
+            self.show_stats()
+
+        if row is not None:
+            self.add_department_option(row.get("department"))
+        if old is not None and old.get("department") != (row or {}).get("department"):
+            self.remove_department_option(old.get("department"))
+
+    def selected_employee(self):
+        selected_rows = self.table.selectionModel().selectedRows()
+        if not selected_rows:
             return None
+        return self.proxy_model.employee(selected_rows[0].row())
 
-        row = selected_items[0].row()
-        id_item = self.table.item(row, 0)
-        return int(id_item.text()) if id_item else None
+    def selected_employee_id(self):
+        emp = self.selected_employee()
+        return emp["id"] if emp else None
 
     def on_add(self):
         dialog = ModernEmployeeFormDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             emp = dialog.get_employee()
-            insert_employee(self.db_path, emp.to_dict())
-            self.refresh_data()
+            self.store.insert(emp.to_dict())  # on_store_change updates the table
 
     def on_edit(self):
-        emp_id = self.selected_employee_id()
-        if not emp_id:
-            QMessageBox.warning(self, "No Selection", "Please select an employee to edit.")
-            return
-
-        # Find employee data
-        employees = self.get_all_employees()
-        emp_dict = next((e for e in employees if e["id"] == emp_id), None)
+        emp_dict = self.selected_employee()
         if not emp_dict:
-            QMessageBox.warning(self, "Not Found", "Selected employee not found.")
+            QMessageBox.warning(self, "No Selection", "Please select an employee to edit.")
             return
 
         dialog = ModernEmployeeFormDialog(self, Employee.from_dict(emp_dict))
         if dialog.exec() == QDialog.DialogCode.Accepted:
             emp = dialog.get_employee()
-            update_employee(self.db_path, emp_id, emp.to_dict())
-            self.refresh_data()
+            if self.store.update(emp_dict["id"], emp.to_dict()) is None:
+                QMessageBox.warning(self, "Not Found", "Selected employee not found.")
 
     def on_delete(self):
-        emp_id = self.selected_employee_id()
-        if not emp_id:
+        emp_dict = self.selected_employee()
+        if not emp_dict:
             QMessageBox.warning(self, "No Selection", "Please select an employee to delete.")
             return
 
-        # Get employee name for confirmation
-        employees = self.get_all_employees()
-        emp_dict = next((e for e in employees if e["id"] == emp_id), None)
-        emp_name = emp_dict.get("name", "Unknown") if emp_dict else "Unknown"
+        emp_name = emp_dict.get("name") or "Unknown"
 
         reply = QMessageBox.question(
             self, "Confirm Delete",
@@ -402,8 +355,7 @@ class ModernEmployeesWidget(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            delete_employee(self.db_path, emp_id)
-            self.refresh_data()
+            self.store.delete(emp_dict["id"])
             QMessageBox.information(self, "Deleted", f"Employee '{emp_name}' has been deleted.")
 
 
@@ -0,0 +1,139 @@
+# instrumentation.py
+"""Switchable stage timing and structured log events for payslip generation.
+
+Timing is off unless enabled with enable() or the PAYSLIP_TIMING=1 environment
+variable; when off, stage() and @timed cost a single flag check.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+
+logger = logging.getLogger("payslip")
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+_enabled = os.environ.get("PAYSLIP_TIMING", "") not in ("", "0")
+
+
+def enable(flag: bool = True) -> None:
+    global _enabled
+    _enabled = bool(flag)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def log_event(event: str, level: int = logging.INFO, **fields) -> None:
+    """Emit a structured log record: message is "event key=value ...", fields are in record.fields."""
+    if logger.isEnabledFor(level):
+        text = " ".join(f"{k}={v}" for k, v in fields.items())
+        logger.log(level, f"{event} {text}".rstrip(), extra={"event": event, "fields": fields})
+
+
+def _percentile(sorted_values, pct):
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+class StageTimings:
+    """Duration samples (seconds) per stage name, with histogram summaries."""
+
+    def __init__(self):
+        self._samples = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, stage_name: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[stage_name].append(seconds)
+
+    def merge(self, samples) -> None:
+        """Add samples drained from another process (see drain())."""
+        with self._lock:
+            for stage_name, values in samples.items():
+                self._samples[stage_name].extend(values)
+
+    def drain(self) -> dict:
+        """Return and clear the raw samples."""
+        with self._lock:
+            samples = dict(self._samples)
+            self._samples = defaultdict(list)
+        return samples
+
+    def reset(self) -> None:
+        self.drain()
+
+    def summary(self) -> dict:
+        with self._lock:
+            snapshot = {name: sorted(values) for name, values in self._samples.items() if values}
+        result = {}
+        for name, values in sorted(snapshot.items()):
+            counts = [0] * (len(BUCKETS_MS) + 1)
+            for v in values:
+                counts[bisect_left(BUCKETS_MS, v * 1000)] += 1
+            labels = [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+            result[name] = {
+                "count": len(values),
+                "total_ms": sum(values) * 1000,
+                "mean_ms": sum(values) / len(values) * 1000,
+                "p50_ms": _percentile(values, 50) * 1000,
+                "p90_ms": _percentile(values, 90) * 1000,
+                "p99_ms": _percentile(values, 99) * 1000,
+                "max_ms": values[-1] * 1000,
+                "histogram": {label: n for label, n in zip(labels, counts) if n},
+            }
+        return result
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.summary(), **kwargs)
+
+    def export_json(self, path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json(indent=2))
+
+    def log_summary(self, level: int = logging.INFO) -> None:
+        for name, stats in self.summary().items():
+            log_event("stage_timing", level, stage=name, count=stats["count"],
+                      mean_ms=round(stats["mean_ms"], 3), p90_ms=round(stats["p90_ms"], 3),
+                      total_ms=round(stats["total_ms"], 1))
+
+
+timings = StageTimings()
+
+
+@contextmanager
+def stage(name: str):
+    """Time the enclosed block as stage name (no-op when timing is disabled)."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.record(name, time.perf_counter() - start)
+
+
+def timed(name: str):
+    """Decorator form of stage()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,359 @@
+# job_queue.py
+"""Crash-resumable payroll batch runs, persisted in the jobs/job_tasks tables.
+
+A job holds one task per employee. Workers (threads or processes, possibly
+several against the same DB file) claim pending tasks in small groups under a
+time-limited lease, renewed after every finished task. A crashed worker's
+tasks become claimable again when the lease expires: a worker that finds
+nothing to claim waits for any outstanding lease instead of exiting, so
+resuming a job picks up exactly what was not finished.
+"""
+import os
+import socket
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from db import ensure_db, get_conn, row_to_dict
+from instrumentation import log_event
+
+LEASE_SECONDS = 120
+CLAIM_SIZE = 8
+POLL_SECONDS = 1.0  # longest a worker sleeps before re-checking leases held by others
+
+
+@dataclass
+class JobStatus:
+    """Task counts for a job."""
+    job_id: int
+    status: str
+    pending: int = 0
+    running: int = 0
+    done: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.pending + self.running + self.done + self.failed
+
+    @property
+    def finished(self) -> bool:
+        return self.pending == 0 and self.running == 0
+
+
+def _connect(db_path) -> sqlite3.Connection:
+    conn = get_conn(Path(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")   # readers don't block the claiming writer
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+def default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+# ------------------- Jobs -------------------
+def create_job(db_path, pay_period: str, output_dir, employee_ids: Sequence[int],
+               renderer: str = "platypus", optimised: bool = False, max_attempts: int = 3) -> int:
+    """Create a job with one pending task per employee and return its id.
+
+    Raises ValueError if two of the employees' payslips would share a file name.
+    """
+    from batch_payslips import check_output_names
+    ensure_db(Path(db_path))
+    check_output_names(db_path, employee_ids, pay_period)
+    conn = _connect(db_path)
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            INSERT INTO jobs (pay_period, output_dir, renderer, optimised, max_attempts)
+            VALUES (?, ?, ?, ?, ?)
+        """, (pay_period, str(output_dir), renderer, int(optimised), max_attempts))
+        job_id = cur.lastrowid
+        cur.executemany("INSERT INTO job_tasks (job_id, employee_id) VALUES (?, ?)",
+                        [(job_id, emp_id) for emp_id in employee_ids])
+        conn.commit()
+    finally:
+        conn.close()
+    log_event("job_created", job_id=job_id, pay_period=pay_period, tasks=len(employee_ids))
+    return job_id
+
+
+def get_job(db_path, job_id: int) -> Optional[Dict]:
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row_to_dict(row) if row else None
+    finally:
+        conn.close()
+
+
+def list_jobs(db_path) -> List[Dict]:
+    conn = _connect(db_path)
+    try:
+        return [row_to_dict(r) for r in conn.execute("SELECT * FROM jobs ORDER BY id DESC")]
+    finally:
+        conn.close()
+
+
+def job_status(db_path, job_id: int) -> JobStatus:
+    conn = _connect(db_path)
+    try:
+        job = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if not job:
+            raise ValueError(f"Job {job_id} not found")
+        status = JobStatus(job_id, job["status"])
+        for row in conn.execute(
+                "SELECT state, COUNT(1) AS cnt FROM job_tasks WHERE job_id = ? GROUP BY state", (job_id,)):
+            setattr(status, row["state"], row["cnt"])
+        return status
+    finally:
+        conn.close()
+
+
+def _finish_job_if_complete(conn, job_id: int) -> None:
+    open_tasks = conn.execute(
+        "SELECT COUNT(1) FROM job_tasks WHERE job_id = ? AND state IN ('pending', 'running')",
+        (job_id,)).fetchone()[0]
+    if open_tasks:
+        return
+    failed = conn.execute("SELECT COUNT(1) FROM job_tasks WHERE job_id = ? AND state = 'failed'",
+                          (job_id,)).fetchone()[0]
+    conn.execute("""
+        UPDATE jobs SET status = ?, finished_at = CURRENT_TIMESTAMP
+        WHERE id = ? AND finished_at IS NULL
+    """, ("failed" if failed else "done", job_id))
+
+
+# ------------------- Tasks -------------------
+def claim_tasks(conn, job_id: int, owner: str, limit: int = CLAIM_SIZE,
+                lease_seconds: float = LEASE_SECONDS) -> List[Dict]:
+    """Atomically lease up to limit claimable tasks to owner.
+
+    Claimable means pending, or running under a lease that has expired. Tasks
+    whose lease expired on their last allowed attempt are marked failed.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")  # take the write lock before reading, so claims never overlap
+    try:
+        max_attempts = conn.execute("SELECT max_attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()[0]
+        conn.execute("""
+            UPDATE job_tasks SET state = 'failed', error = 'Lease expired', lease_owner = NULL,
+                   updated_at = CURRENT_TIMESTAMP
+            WHERE job_id = ? AND state = 'running' AND lease_expires < ? AND attempts >= ?
+        """, (job_id, now, max_attempts))
+        rows = conn.execute("""
+            SELECT id FROM job_tasks
+            WHERE job_id = ? AND (state = 'pending' OR (state = 'running' AND lease_expires < ?))
+            ORDER BY id LIMIT ?
+        """, (job_id, now, limit)).fetchall()
+        ids = [r["id"] for r in rows]
+        if ids:
+            marks = ",".join("?" * len(ids))
+            conn.execute(f"""
+                UPDATE job_tasks SET state = 'running', lease_owner = ?, lease_expires = ?,
+                       attempts = attempts + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE id IN ({marks})
+            """, (owner, now + lease_seconds, *ids))
+            conn.execute("UPDATE jobs SET status = 'running' WHERE id = ? AND status = 'pending'", (job_id,))
+        else:
+            _finish_job_if_complete(conn, job_id)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if not ids:
+        return []
+    marks = ",".join("?" * len(ids))
+    return [row_to_dict(r) for r in conn.execute(
+        f"SELECT * FROM job_tasks WHERE id IN ({marks}) ORDER BY id", ids)]
+
+
+def renew_leases(conn, job_id: int, owner: str, lease_seconds: float = LEASE_SECONDS) -> int:
+    """Push back the lease expiry of every task of job_id that owner still holds."""
+    cur = conn.execute("""
+        UPDATE job_tasks SET lease_expires = ?
+        WHERE job_id = ? AND state = 'running' AND lease_owner = ?
+    """, (time.time() + lease_seconds, job_id, owner))
+    conn.commit()
+    return cur.rowcount
+
+
+def next_lease_expiry(conn, job_id: int) -> Optional[float]:
+    """Earliest lease expiry among running tasks of job_id, or None if none are running."""
+    return conn.execute("SELECT MIN(lease_expires) FROM job_tasks WHERE job_id = ? AND state = 'running'",
+                        (job_id,)).fetchone()[0]
+
+
+def complete_task(conn, task_id: int, owner: str, output_path: str) -> bool:
+    """Mark a leased task done. Returns False if owner no longer holds the lease."""
+    cur = conn.execute("""
+        UPDATE job_tasks SET state = 'done', output_path = ?, error = NULL, lease_owner = NULL,
+               lease_expires = NULL, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ? AND state = 'running' AND lease_owner = ?
+    """, (output_path, task_id, owner))
+    conn.commit()
+    return cur.rowcount > 0
+
+
+def fail_task(conn, task_id: int, owner: str, error: str) -> bool:
+    """Record a failed attempt: back to pending for a retry, or failed once attempts run out."""
+    cur = conn.execute("""
+        UPDATE job_tasks SET
+            state = CASE WHEN attempts >= (SELECT max_attempts FROM jobs WHERE jobs.id = job_tasks.job_id)
+                         THEN 'failed' ELSE 'pending' END,
+            error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ? AND state = 'running' AND lease_owner = ?
+    """, (error, task_id, owner))
+    conn.commit()
+    return cur.rowcount > 0
+
+
+def release_leases(db_path, job_id: int) -> int:
+    """Return every running task of job_id to pending (only when no worker is still alive)."""
+    conn = _connect(db_path)
+    try:
+        cur = conn.execute("""
+            UPDATE job_tasks SET state = 'pending', lease_owner = NULL, lease_expires = NULL,
+                   updated_at = CURRENT_TIMESTAMP
+            WHERE job_id = ? AND state = 'running'
+        """, (job_id,))
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def retry_failed(db_path, job_id: int) -> int:
+    """Give failed tasks a fresh set of attempts and reopen the job."""
+    conn = _connect(db_path)
+    try:
+        cur = conn.execute("""
+            UPDATE job_tasks SET state = 'pending', attempts = 0, updated_at = CURRENT_TIMESTAMP
+            WHERE job_id = ? AND state = 'failed'
+        """, (job_id,))
+        if cur.rowcount:
+            conn.execute("UPDATE jobs SET status = 'running', finished_at = NULL WHERE id = ?", (job_id,))
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+# ------------------- Workers -------------------
+def _write_payslip(generator, emp, job) -> str:
+    """Render to a temporary file and rename it into place, so no partial PDF is left by a crash."""
+    out_dir = Path(job["output_dir"])
+    out_dir.mkdir(parents=True, exist_ok=True)
+    filename = generator.payslip_filename(emp, emp["id"], job["pay_period"], out_dir)
+    tmp = filename.with_name(filename.name + ".part")
+    tmp.write_bytes(generator.render_pdf_bytes(emp, job["pay_period"], job["renderer"]))
+    os.replace(tmp, filename)
+    return str(filename)
+
+
+def run_worker(db_path, job_id: int, owner: Optional[str] = None, claim_size: int = CLAIM_SIZE,
+               lease_seconds: float = LEASE_SECONDS, poll_seconds: float = POLL_SECONDS) -> int:
+    """Claim and process tasks of job_id until none are pending or running. Returns the number processed.
+
+    While other owners still hold running tasks the worker sleeps (at most
+    poll_seconds at a time) and claims again, so tasks of a worker that died
+    are picked up once their lease expires.
+    """
+    from db import get_employee_by_id
+    from payslip_generator import get_generator
+
+    owner = owner or default_owner()
+    job = get_job(db_path, job_id)
+    if not job:
+        raise ValueError(f"Job {job_id} not found")
+    generator = get_generator(bool(job["optimised"]))
+
+    processed = 0
+    conn = _connect(db_path)
+    try:
+        while True:
+            tasks = claim_tasks(conn, job_id, owner, claim_size, lease_seconds)
+            if not tasks:
+                expiry = next_lease_expiry(conn, job_id)
+                if expiry is None:
+                    break
+                time.sleep(min(max(expiry - time.time(), 0.01), poll_seconds))
+                continue
+            for task in tasks:
+                try:
+                    emp = get_employee_by_id(conn, task["employee_id"])
+                    if not emp:
+                        raise ValueError(f"Employee ID {task['employee_id']} not found")
+                    path = _write_payslip(generator, emp, job)
+                    complete_task(conn, task["id"], owner, path)
+                except Exception as e:
+                    fail_task(conn, task["id"], owner, str(e))
+                    log_event("job_task_failed", job_id=job_id, employee_id=task["employee_id"],
+                              attempt=task["attempts"], error=str(e))
+                processed += 1
+                renew_leases(conn, job_id, owner, lease_seconds)  # the rest of the claim stays ours
+    finally:
+        conn.close()
+    return processed
+
+
+def run_job(db_path, job_id: int, workers: Optional[int] = None,
+            on_progress: Optional[Callable[[JobStatus], None]] = None,
+            poll_seconds: float = 1.0) -> JobStatus:
+    """Process a job (new or interrupted) with workers processes and return its final status.
+
+    Several run_job/run_worker calls may work on the same job at once, from
+    different processes or machines sharing the DB file. If the pool breaks
+    (a worker process died), the remaining tasks are finished in-process,
+    waiting for the dead worker's leases to expire.
+    """
+    db_path = str(db_path)
+    pending = job_status(db_path, job_id)
+    workers = max(1, min(workers or os.cpu_count() or 1, pending.pending + pending.running or 1))
+    start = time.perf_counter()
+    log_event("job_started", job_id=job_id, workers=workers, pending=pending.pending,
+              running=pending.running, done=pending.done)
+
+    if workers == 1:
+        run_worker(db_path, job_id)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_worker, db_path, job_id) for _ in range(workers)}
+            while futures:
+                finished, futures = wait(futures, timeout=poll_seconds, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        log_event("job_worker_died", job_id=job_id, error=str(e))
+                if on_progress:
+                    on_progress(job_status(db_path, job_id))
+        if not job_status(db_path, job_id).finished:
+            # A dead process breaks the whole pool; its leased tasks are reclaimed here
+            run_worker(db_path, job_id)
+
+    status = job_status(db_path, job_id)
+    if on_progress:
+        on_progress(status)
+    log_event("job_finished", job_id=job_id, status=status.status, done=status.done,
+              failed=status.failed, open=status.pending + status.running,
+              elapsed_s=round(time.perf_counter() - start, 3))
+    return status
+
+
+def resume_job(db_path, job_id: int, workers: Optional[int] = None, release: bool = False,
+               on_progress: Optional[Callable[[JobStatus], None]] = None) -> JobStatus:
+    """Continue an interrupted job.
+
+    release=True hands back tasks still leased to crashed workers immediately
+    instead of waiting for their leases to expire; only use it when no other
+    worker is running the job.
+    """
+    if release:
+        released = release_leases(db_path, job_id)
+        log_event("job_leases_released", job_id=job_id, tasks=released)
+    return run_job(db_path, job_id, workers, on_progress)
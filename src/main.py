@@ -1,6 +1,11 @@
 # main.py
+import time
+STARTUP_T0 = time.perf_counter()  # before the Qt imports, which dominate startup
+
 import sys
 import os
+import logging
+import multiprocessing
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -9,14 +14,13 @@ from PyQt6.QtWidgets import (
     QGridLayout, QSpacerItem, QSizePolicy
 )
 from PyQt6.QtGui import QIcon, QPixmap, QFont, QPainter, QPainterPath , QGuiApplication
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, pyqtSignal
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QThreadPool, QTimer, pyqtSignal
 
 # local modules
 from db import ensure_db
-from employees_crud import ModernEmployeesWidget, Employee
-from payslip_generator import ModernPayslipGenerator
+from instrumentation import log_event
+from payslip_worker import GeneratorWarmup
 from ui_helpers import ModernCard, GlassButton, ModernInput
-from PayslipPage import PayslipPage
 from sidemenu import ModernSidebar, SidebarButton
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -24,7 +28,18 @@ ASSETS_DIR = BASE_DIR / "assets"
 STYLES_DIR = BASE_DIR / "styles"
 DB_PATH = BASE_DIR / "data" / "employees.db"
 
+if hasattr(sys, "_MEIPASS"):
+    STYLESHEET_PATH = Path(sys._MEIPASS) / "styles" / "style.qss"
+else:
+    STYLESHEET_PATH = STYLES_DIR / "style.qss"
+
 
+def load_stylesheet(app):
+    """Apply styles/style.qss to the whole application (parsed once, shared by every widget)."""
+    try:
+        app.setStyleSheet(STYLESHEET_PATH.read_text(encoding="utf-8"))
+    except OSError as e:
+        log_event("stylesheet_missing", logging.WARNING, path=str(STYLESHEET_PATH), error=str(e))
 
 
 class ModernHeader(QFrame):
@@ -40,11 +55,7 @@ class ModernHeader(QFrame):
 
         # Page title
         self.title_label = QLabel("Employee Management")
-        self.title_label.setStyleSheet("""
-            font-size: 24px;
-            font-weight: 700;
-            color: #1e293b;
-        """)
+        self.title_label.setObjectName("pageTitle")
         layout.addWidget(self.title_label)
 
         layout.addStretch()
@@ -53,14 +64,6 @@ class ModernHeader(QFrame):
         self.action_layout = QHBoxLayout()
         layout.addLayout(self.action_layout)
 
-        # Header styling
-        self.setStyleSheet("""
-            QFrame#header {
-                background: white;
-                border-bottom: 1px solid #e2e8f0;
-            }
-        """)
-
     def set_title(self, title):
         self.title_label.setText(title)
 
@@ -83,31 +86,25 @@ class ModernMainWindow(QWidget):
         super().__init__()
         self.setWindowTitle("Mariomed Payslip Generator")
 
-        self.setStyleSheet(self.get_main_stylesheet())
-
         # Ensure database
         ensure_db(DB_PATH)
 
+        self.first_paint_done = False
         self.init_ui()
 
-    def get_main_stylesheet(self):
-        return """
-            QWidget {
-                background-color: #f8fafc;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                color: #1e293b;
-            }
-
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-
-            QMessageBox {
-                background-color: white;
-                color: #1e293b;
-            }
-        """
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            startup_ms = (time.perf_counter() - STARTUP_T0) * 1000
+            log_event("startup", time_to_first_paint_ms=round(startup_ms, 1))
+            if os.environ.get("PAYSLIP_STARTUP_PROBE"):
+                # Startup benchmark: report and quit without warming up
+                print(f"time_to_first_paint_ms={startup_ms:.1f}", flush=True)
+                QTimer.singleShot(0, QApplication.instance().quit)
+                return
+            # Warm ReportLab up in the background once the window is on screen
+            QTimer.singleShot(0, lambda: QThreadPool.globalInstance().start(GeneratorWarmup()))
 
     def init_ui(self):
         layout = QHBoxLayout(self)
@@ -129,15 +126,15 @@ class ModernMainWindow(QWidget):
         self.header = ModernHeader()
         content_layout.addWidget(self.header)
 
-        # Page stack
+        # Page stack: pages are built on first navigation (see page())
         self.page_stack = QStackedWidget()
-
-        # Create pages
-        self.employees_page = ModernEmployeesWidget(DB_PATH)
-        self.payslip_page = PayslipPage(DB_PATH)
-
-        self.page_stack.addWidget(self.employees_page)
-        self.page_stack.addWidget(self.payslip_page)
+        self.page_specs = [
+            ("👥 Employee Management", self.create_employees_page),
+            ("📄 Payslip Generation", self.create_payslip_page),
+        ]
+        self.pages = {}
+        for _ in self.page_specs:
+            self.page_stack.addWidget(QWidget())  # placeholder
 
         content_layout.addWidget(self.page_stack)
         layout.addWidget(content_frame)
@@ -145,16 +142,35 @@ class ModernMainWindow(QWidget):
         # Set initial page
         self.on_page_changed(0)
 
+    # Page modules are imported by their factories, so unvisited pages cost nothing at startup
+    def create_employees_page(self):
+        from employees_crud import ModernEmployeesWidget
+        return ModernEmployeesWidget(DB_PATH)
+
+    def create_payslip_page(self):
+        from PayslipPage import PayslipPage
+        return PayslipPage(DB_PATH)
+
+    def page(self, index):
+        """Return the page at index, building it (and replacing its placeholder) on first use."""
+        if index not in self.pages:
+            _, factory = self.page_specs[index]
+            widget = factory()
+            placeholder = self.page_stack.widget(index)
+            self.page_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.page_stack.insertWidget(index, widget)
+            self.pages[index] = widget
+        return self.pages[index]
+
     def on_page_changed(self, index):
-        self.page_stack.setCurrentIndex(index)
-
-        if index == 0:
-            self.header.set_title("👥 Employee Management")
-        elif index == 1:
-            self.header.set_title("📄 Payslip Generation")
-            # Refresh employee list when switching to payslip page
-            self.payslip_page.refresh_employee_list()
+        # Pages load and refresh their own data when shown
+        self.page_stack.setCurrentWidget(self.page(index))
+        self.header.set_title(self.page_specs[index][0])
+
+
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     app = QApplication(sys.argv)
 
     # --- App-level properties ---
@@ -172,6 +188,7 @@ def main():
 
     # Set icon globally for app (taskbar + dialogs)
     app.setWindowIcon(QIcon(str(icon_path)))
+    load_stylesheet(app)
 
     # --- Main Window ---
     window = ModernMainWindow()
@@ -188,4 +205,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Needed for batch generation worker processes in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     main()
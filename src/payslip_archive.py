@@ -0,0 +1,72 @@
+# payslip_archive.py
+import zipfile
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from batch_payslips import check_output_names, select_employee_ids
+from employee_store import get_store
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object that hands out what was written so far."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_rendered(db_path, pay_period, department, status, employee_ids, optimised):
+    """Yield (archive name, PDF bytes) for each matching employee, rendered one at a time."""
+    from payslip_generator import get_generator
+    generator = get_generator(optimised)
+    store = get_store(db_path)
+    ids = select_employee_ids(db_path, department, status, employee_ids)
+    check_output_names(db_path, ids, pay_period)  # ZIP entry names must be unique too
+    for emp_id in ids:
+        emp = store.get(emp_id)
+        name = generator.payslip_filename(emp, emp_id, pay_period, Path()).name
+        yield name, generator.render_pdf_bytes(emp, pay_period)
+
+
+def write_payslip_zip(fileobj, db_path, pay_period: str, department: Optional[str] = None,
+                      status: Optional[str] = "Active", employee_ids: Optional[Sequence[int]] = None,
+                      compression: int = zipfile.ZIP_DEFLATED, optimised: bool = False) -> int:
+    """Render each matching payslip in memory and add it to a ZIP written to fileobj.
+
+    Each PDF is added as soon as it is rendered, so only one payslip is held in
+    memory at a time; fileobj does not need to be seekable (sockets, HTTP
+    responses). Returns the number of payslips written.
+    """
+    count = 0
+    with zipfile.ZipFile(fileobj, mode="w", compression=compression) as archive:
+        for name, pdf in _iter_rendered(db_path, pay_period, department, status, employee_ids, optimised):
+            archive.writestr(name, pdf)
+            count += 1
+    return count
+
+
+def iter_payslip_zip(db_path, pay_period: str, department: Optional[str] = None,
+                     status: Optional[str] = "Active", employee_ids: Optional[Sequence[int]] = None,
+                     compression: int = zipfile.ZIP_DEFLATED, optimised: bool = False) -> Iterator[bytes]:
+    """Yield a ZIP archive of payslips as byte chunks, one chunk per rendered payslip.
+
+    Suitable for streaming a download straight to a client without temp files.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=compression) as archive:
+        for name, pdf in _iter_rendered(db_path, pay_period, department, status, employee_ids, optimised):
+            archive.writestr(name, pdf)
+            yield sink.drain()
+    # Central directory is written on close
+    yield sink.drain()
@@ -0,0 +1,261 @@
+# payslip_canvas.py
+from types import SimpleNamespace
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+from db import compute_financials
+
+# Geometry mirrors the platypus tables in ModernPayslipGenerator (points)
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGINS = SimpleNamespace(left=10*mm, right=10*mm, top=15*mm, bottom=15*mm)
+FRAME_PADDING = 6
+
+CARD_WIDTH = 530
+CARD_LEFT_WIDTH = CARD_WIDTH * 0.55
+CARD_RIGHT_WIDTH = CARD_WIDTH - CARD_LEFT_WIDTH
+EARNINGS_COL_WIDTHS = (60*0.85*mm, 50*0.85*mm)
+NET_PAYABLE_COL_WIDTHS = (140*mm, 60*mm)
+WORDS_WIDTH = 200*mm
+
+
+def wrap_lines(text, font, size, width, space_shrinkage=0.05):
+    """Break text into lines the way Paragraph does.
+
+    Breaks at spaces, letting each space on a line shrink by space_shrinkage
+    of its width (ParagraphStyle.spaceShrinkage); a word wider than the line
+    fills what is left of the current line and continues on the next
+    (Paragraph's splitLongWords).
+    """
+    shrink = space_shrinkage * stringWidth(" ", font, size)
+    lines, line, words_on_line = [], "", 0
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if stringWidth(candidate, font, size) <= width + shrink * words_on_line:
+            line = candidate
+            words_on_line += 1
+        elif stringWidth(word, font, size) <= width:
+            lines.append(line)
+            line, words_on_line = word, 1
+        else:
+            current = f"{line} " if line else ""
+            for ch in word:
+                if current.strip() and stringWidth(current + ch, font, size) > width:
+                    lines.append(current.rstrip())
+                    current = ""
+                current += ch
+            line, words_on_line = current, 1
+    if line:
+        lines.append(line)
+    return lines
+
+
+class CanvasPayslipRenderer:
+    """Draw a payslip with direct canvas calls at precomputed coordinates.
+
+    Produces the same page as the platypus path of ModernPayslipGenerator
+    (same styles, colours, static header/footer form) without flowable layout.
+    """
+
+    def __init__(self, generator):
+        self.gen = generator
+        self.colors = generator.colors
+        self.bold_font = 'Helvetica-Bold' if generator.font_name == 'Helvetica' else generator.font_name
+        # Only the attributes draw_static_template reads
+        self.doc = SimpleNamespace(pagesize=A4, topMargin=MARGINS.top, bottomMargin=MARGINS.bottom)
+
+    # ------------------- Primitives -------------------
+    def _text(self, c, text, style, x, width, baseline, font=None):
+        """Draw a single line at baseline, aligned within [x, x + width] like the style."""
+        c.setFont(font or style.fontName, style.fontSize)
+        c.setFillColor(style.textColor)
+        if style.alignment == TA_RIGHT:
+            c.drawRightString(x + width, baseline, text)
+        elif style.alignment == TA_CENTER:
+            c.drawCentredString(x + width / 2, baseline, text)
+        else:
+            c.drawString(x, baseline, text)
+
+    def _lines(self, text, style, width, font=None):
+        return wrap_lines(text, font or style.fontName, style.fontSize, width, style.spaceShrinkage)
+
+    def _para(self, c, lines, style, x, width, baseline, font=None):
+        """Draw wrapped lines from the first baseline down, one leading apart."""
+        for line in lines:
+            self._text(c, line, style, x, width, baseline, font)
+            baseline -= style.leading
+
+    def _middle_baseline(self, row_top, row_height, top_pad, bottom_pad, style, lines=1):
+        """Baseline of the first line of a vertically centred paragraph."""
+        content = style.leading * lines
+        content_top = row_top - top_pad - (row_height - top_pad - bottom_pad - content) / 2
+        return content_top - style.fontSize
+
+    def _box(self, c, x, y, w, h, fill=None, stroke=None, line_width=1):
+        c.setLineWidth(line_width)
+        if fill is not None:
+            c.setFillColor(fill)
+        if stroke is not None:
+            c.setStrokeColor(stroke)
+        c.rect(x, y, w, h, stroke=int(stroke is not None), fill=int(fill is not None))
+
+    # ------------------- Sections -------------------
+    def draw_summary_card(self, c, top, emp, fin, pay_period):
+        g = self.gen
+        left_width, right_width = CARD_LEFT_WIDTH - 20, CARD_RIGHT_WIDTH - 12   # cell padding 15/5, 6/6
+        rows = [
+            ("EMPLOYEE SUMMARY", g.section_header_style, self.bold_font),
+            ("Employee Name", g.label_style, None),
+            (f": {emp.get('name', 'N/A')}", g.value_style, None),
+            ("Employee ID", g.label_style, None),
+            (f": {emp.get('emp_code') or 'N/A'}", g.value_style, None),
+            ("Pay Period", g.label_style, None),
+            (pay_period, g.value_style, None),
+            ("Designation", g.label_style, None),
+            (f": {emp.get('designation', 'N/A')}", g.value_style, None),
+            ("PAN No", g.label_style, None),
+            (f": {emp.get('pan', 'N/A')}", g.value_style, None),
+        ]
+        left = [(self._lines(text, style, left_width, font), style, font) for text, style, font in rows]
+        left_height = sum(style.leading * len(lines) + 4 for lines, style, _ in left)     # 2/2 padding
+        right = [(self._lines(text, style, right_width), style)
+                 for style, text in ((g.net_pay_amount_style, g.format_currency(fin['net'])),
+                                     (g.net_pay_label_style, "Employee Net Pay"))]
+        right_height = sum(style.leading * len(lines) + 23 for lines, style in right)     # 3/20 padding
+        card_height = max(left_height, right_height) + 10
+
+        x = (PAGE_WIDTH - CARD_WIDTH) / 2
+        self._box(c, x, top - card_height, CARD_WIDTH, card_height,
+                  fill=self.colors['card'], stroke=self.colors['border'])
+
+        row_top = top
+        for lines, style, font in left:
+            self._para(c, lines, style, x + 15, left_width, row_top - 2 - style.fontSize, font)
+            row_top -= style.leading * len(lines) + 4
+
+        right_x = x + CARD_LEFT_WIDTH
+        self._box(c, right_x, top - right_height, CARD_RIGHT_WIDTH, right_height,
+                  fill=self.colors['background'], stroke=self.colors['border'])
+        row_top = top
+        for lines, style in right:
+            self._para(c, lines, style, right_x + 6, right_width, row_top - 3 - style.fontSize)
+            row_top -= style.leading * len(lines) + 23
+
+        return card_height
+
+    def _amount_table_cells(self, rows):
+        """Wrap each cell of an earnings/deductions table; returns (cells, natural height)."""
+        w0, w1 = EARNINGS_COL_WIDTHS
+        cells = [((self._lines(label, label_style, w0 - 20), label_style),
+                  (self._lines(amount, amount_style, w1 - 20), amount_style))
+                 for (label, label_style), (amount, amount_style) in rows]
+        height = sum(max(style.leading * len(lines) for lines, style in row) + 12 for row in cells)  # 6/6 padding
+        return cells, height
+
+    def _draw_amount_table(self, c, x, top, cells, row_height):
+        w0, w1 = EARNINGS_COL_WIDTHS
+        width, height = w0 + w1, row_height * len(cells)
+        bottom = top - height
+
+        c.setFillColor(self.colors['background'])
+        c.rect(x, top - row_height, width, row_height, stroke=0, fill=1)
+        c.rect(x, bottom, width, row_height, stroke=0, fill=1)
+
+        c.setStrokeColor(self.colors['border'])
+        c.setLineWidth(0.5)
+        for i in range(1, len(cells)):
+            y = top - i * row_height
+            c.line(x, y, x + width, y)
+        c.line(x + w0, top, x + w0, bottom)
+        self._box(c, x, bottom, width, height, stroke=self.colors['border'])
+
+        for i, row in enumerate(cells):
+            row_top = top - i * row_height
+            for (lines, style), cx, cw in zip(row, (x, x + w0), (w0, w1)):
+                if lines:
+                    baseline = self._middle_baseline(row_top, row_height, 6, 6, style, len(lines))
+                    self._para(c, lines, style, cx + 10, cw - 20, baseline)
+        return height
+
+    def draw_earnings_deductions(self, c, top, fin):
+        g = self.gen
+        head, label, amount = g.earnings_header_style, g.label_style, g.amount_style
+        cur = g.format_currency
+        earnings = [
+            (("EARNINGS", head), ("AMOUNT", head)),
+            (("Basic", label), (cur(fin["basic"]), amount)),
+            (("House Rent Allowance", label), (cur(fin["hra"]), amount)),
+            (("LTA", label), (cur(fin["LTA"]), amount)),
+            (("Special Allowance", label), (cur(fin["special_allowance"]), amount)),
+            (("Gross Earnings", head), (cur(fin["gross"]), head)),
+        ]
+        deductions = [
+            (("DEDUCTIONS", head), ("AMOUNT", head)),
+            (("Income Tax", label), (cur(fin["income_tax"]), amount)),
+            (("", label), ("", amount)),
+            (("", label), ("", amount)),
+            (("", label), ("", amount)),
+            (("Total Deductions", head), (cur(fin["income_tax"]), head)),
+        ]
+        earnings, earnings_height = self._amount_table_cells(earnings)
+        deductions, deductions_height = self._amount_table_cells(deductions)
+        # Both tables share one row height, as the platypus section forces
+        row_height = max(earnings_height, deductions_height) / len(earnings)
+        table_width = sum(EARNINGS_COL_WIDTHS)
+        x = (PAGE_WIDTH - 2 * table_width) / 2
+        self._draw_amount_table(c, x, top, earnings, row_height)
+        return self._draw_amount_table(c, x + table_width, top, deductions, row_height)
+
+    def draw_net_payable(self, c, top, fin):
+        g = self.gen
+        w0, w1 = NET_PAYABLE_COL_WIDTHS
+        x = (PAGE_WIDTH - w0 - w1) / 2
+        title = (self._lines("TOTAL NET PAYABLE", g.section_header_style, w0 - 40), g.section_header_style)
+        amount = (self._lines(g.format_currency(fin['net']), g.net_pay_amount_style, w1 - 40),
+                  g.net_pay_amount_style)
+        note = (self._lines("Gross Earnings - Total Deductions", g.label_style, w0 - 40), g.label_style)
+        row0 = max(style.leading * len(lines) for lines, style in (title, amount)) + 30   # 15/15 padding
+        row1 = g.label_style.leading * len(note[0]) + 30
+        height = row0 + row1
+
+        self._box(c, x, top - height, w0 + w1, height, fill=self.colors['success'])
+        self._box(c, x, top - row0, w0 + w1, row0, fill=colors.HexColor('#DCFCE7'))
+        self._box(c, x, top - height, w0 + w1, height, stroke=self.colors['success'])
+
+        for (lines, style), cx, cw, row_top, row_height in ((title, x, w0, top, row0),
+                                                            (amount, x + w0, w1, top, row0),
+                                                            (note, x, w0, top - row0, row1)):
+            baseline = self._middle_baseline(row_top, row_height, 15, 15, style, len(lines))
+            self._para(c, lines, style, cx + 20, cw - 40, baseline)
+        return height
+
+    def draw_amount_in_words(self, c, top, fin):
+        from amount_words import rupees_in_words
+        style = self.gen.label_style
+        x = (PAGE_WIDTH - WORDS_WIDTH) / 2
+        lines = self._lines(f"Amount In Words : {rupees_in_words(fin['net'])}", style, WORDS_WIDTH - 40)
+        self._para(c, lines, style, x + 20, WORDS_WIDTH - 40, top - 10 - style.fontSize)
+        return style.leading * len(lines) + 20
+
+    # ------------------- Page -------------------
+    def draw_page(self, c, emp, pay_period):
+        """Draw one full payslip page (static form + variable sections)."""
+        fin = compute_financials(emp)
+        self.gen.draw_static_template(c, self.doc)
+
+        y = PAGE_HEIGHT - MARGINS.top - FRAME_PADDING - self.gen.static_header_height() - 12
+        y -= self.draw_summary_card(c, y, emp, fin, pay_period) + 15
+        y -= self.draw_earnings_deductions(c, y, fin) + 10
+        y -= self.draw_net_payable(c, y, fin) + 8
+        self.draw_amount_in_words(c, y, fin)
+        c.showPage()
+
+    def render(self, emp, pay_period, target):
+        """Render a single-page payslip into target (a filename or binary file object)."""
+        c = canvas.Canvas(target, pagesize=A4, invariant=1)
+        self.draw_page(c, emp, pay_period)
+        c.save()
@@ -1,4 +1,5 @@
 from pathlib import Path
+import reportlab
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import mm, inch
@@ -6,60 +7,271 @@ from reportlab.platypus import Table, TableStyle, Paragraph, SimpleDocTemplate,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfdoc import PDFImageXObject, PDFObjectReference, xObjectName
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus.flowables import HRFlowable
-
-from num2words import num2words
+from reportlab.platypus.flowables import HRFlowable, Flowable, PageBreak
+
+from functools import lru_cache
+import copy
+import hashlib
+import io
+import json
+import logging
 import os
 import sys
+import threading
 
 # Add the parent directory to Python path to import db module
 sys.path.append(str(Path(__file__).parent.parent))
-from db import get_employee_by_id, compute_financials
+from db import get_conn, get_employee_by_id, compute_financials, get_manifest_entry, upsert_manifest_entry
+from amount_words import rupees_in_words
+from instrumentation import log_event, stage, timed
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+def user_cache_dir() -> Path:
+    """Per-user cache directory (PAYSLIP_CACHE_DIR overrides it).
+
+    Machine-specific state goes here rather than under BASE_DIR, which is the
+    source tree, or the temporary _MEIPASS directory in a PyInstaller build.
+    """
+    override = os.environ.get("PAYSLIP_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Caches"
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "payslip"
+
+
+# Resolved font path is remembered here so later runs skip the filesystem probe
+FONT_CACHE_PATH = user_cache_dir() / "font_cache.json"
+
+# List of common font paths for different systems
+FONT_PATHS = [
+    # Windows
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/calibri.ttf",
+    # macOS
+    "/System/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    # Linux/Ubuntu
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    # Local fonts (place fonts in assets folder)
+    str(BASE_DIR / "assets" / "DejaVuSans.ttf"),
+    str(BASE_DIR / "assets" / "Arial.ttf"),
+]
+
+
+def _load_cached_font_path():
+    try:
+        return json.loads(FONT_CACHE_PATH.read_text(encoding="utf-8")).get("font_path")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _save_cached_font_path(font_path):
+    try:
+        FONT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        FONT_CACHE_PATH.write_text(json.dumps({"font_path": font_path}), encoding="utf-8")
+    except OSError:
+        pass
+
 
 # Try to register fonts that support currency symbols
+@lru_cache(maxsize=None)
 def register_fonts():
-    """Register fonts with currency symbol support"""
+    """Register fonts with currency symbol support (once per process)."""
     font_registered = False
 
-    # List of common font paths for different systems
-    font_paths = [
-        # Windows
-        "C:/Windows/Fonts/arial.ttf",
-        "C:/Windows/Fonts/calibri.ttf",
-        # macOS
-        "/System/Library/Fonts/Arial.ttf",
-        "/System/Library/Fonts/Helvetica.ttc",
-        # Linux/Ubuntu
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-        # Local fonts (place fonts in assets folder)
-        str(Path(__file__).parent.parent / "assets" / "DejaVuSans.ttf"),
-        str(Path(__file__).parent.parent / "assets" / "Arial.ttf"),
-    ]
+    cached_path = _load_cached_font_path()
+    font_paths = ([cached_path] if cached_path else []) + FONT_PATHS
 
     for font_path in font_paths:
         try:
             if os.path.exists(font_path):
                 pdfmetrics.registerFont(TTFont('CustomFont', font_path))
                 font_registered = True
-                print(f"Font registered successfully: {font_path}")
+                if font_path != cached_path:
+                    _save_cached_font_path(font_path)
+                log_event("font_registered", font_path=font_path, cached=font_path == cached_path)
                 break
         except Exception as e:
             continue
 
     if not font_registered:
-        print("Warning: No custom font found. Using default font. Currency symbols may not render properly.")
+        log_event("font_fallback", logging.WARNING, font="Helvetica",
+                  reason="no custom font found; currency symbols may not render properly")
         return 'Helvetica'  # Fallback to default
 
     return 'CustomFont'
 
+# Logo is drawn 25mm wide; optimised output resamples it to this resolution
+LOGO_SIZE = 25 * mm
+LOGO_OPTIMISED_DPI = 150
+
+
+@lru_cache(maxsize=4)
+def optimised_logo_png(logo_path: str, dpi: int = LOGO_OPTIMISED_DPI) -> bytes:
+    """Return the logo downscaled to dpi at its printed size, as PNG bytes (cached per process)."""
+    from PIL import Image as PILImage
+
+    target_px = max(1, round(LOGO_SIZE / inch * dpi))
+    with PILImage.open(logo_path) as img:
+        img.load()
+        if max(img.size) > target_px:
+            img.thumbnail((target_px, target_px), PILImage.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+# Default Frame padding used by SimpleDocTemplate's single frame
+FRAME_PADDING = 6
+
+# Bump whenever the payslip layout changes so incremental runs rebuild every PDF
+TEMPLATE_VERSION = "3"
+
+# Page renderers: "platypus" lays out flowables, "canvas" draws at fixed coordinates
+RENDERERS = ("platypus", "canvas")
+
+# Employee fields that appear on (or affect) the payslip
+PAYSLIP_FIELDS = ("emp_code", "name", "designation", "pan")
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def payslip_filename(emp, employee_id: int, pay_period: str, out_dir: Path) -> Path:
+    """Output path of one payslip; employees without a code are named by id."""
+    safe_emp_code = str(emp.get('emp_code') or f"ID{employee_id}").replace('/', '_')
+    safe_period = pay_period.replace(' ', '_').replace('/', '_')
+    return out_dir / f"Payslip_{safe_emp_code}_{safe_period}.pdf"
+
+
+class OutlineEntry(Flowable):
+    """Zero-size flowable that bookmarks the current page in the PDF outline."""
+
+    def __init__(self, key, title):
+        super().__init__()
+        self.key = key
+        self.title = title
+
+    def wrap(self, availWidth, availHeight):
+        return (0, 0)
+
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=0)
+
+
+# SharedImage mirrors the private parts of Canvas.drawImage (_code, _formsinuse,
+# idToObject, PDFImageXObject._smask); verified identical output on these releases
+SHARED_IMAGE_REPORTLAB = ((3, 6), (5, 0))
+_REPORTLAB_VERSION = tuple(int(p) for p in reportlab.Version.split(".")[:2] if p.isdigit())
+
+
+class SharedImage(Image):
+    """Image flowable whose encoded PDF image object is built once and reused.
+
+    canvas.drawImage deflates and ASCII85-encodes the pixels again for every
+    new document; this keeps the encoded image XObject (and its soft mask) and
+    registers a shallow copy of them (sharing the encoded stream) in each
+    document it is drawn into. On a ReportLab release outside
+    SHARED_IMAGE_REPORTLAB it falls back to a plain Image.
+    """
+
+    supported = SHARED_IMAGE_REPORTLAB[0] <= _REPORTLAB_VERSION <= SHARED_IMAGE_REPORTLAB[1]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._xobjects = None
+        self._xobjects_lock = threading.Lock()
+
+    def get_xobjects(self):
+        """(image, soft mask or None) PDF objects, encoded on first call."""
+        if self._xobjects is None:
+            with self._xobjects_lock:
+                if self._xobjects is None:
+                    reader = self._img
+                    name = hashlib.md5(reader.getRGBData() + str(self._mask).encode("utf-8")).hexdigest()
+                    image = PDFImageXObject(name, reader, mask=self._mask)
+                    smask = image.__dict__.pop("_smask", None)
+                    if smask is not None:
+                        image.smask = PDFObjectReference(xObjectName(smask.name))
+                    self._xobjects = (image, smask)
+        return self._xobjects
+
+    def draw(self):
+        if not self.supported:
+            return super().draw()
+        canv, doc = self.canv, self.canv._doc
+        image, smask = self.get_xobjects()
+        reg_name = xObjectName(image.name)
+        if doc.idToObject.get(reg_name) is None:
+            # First use in this document: register copies (a PDF object can only
+            # belong to one document) the way drawImage registers new images
+            doc.addForm(image.name, copy.copy(image))
+            if smask is not None and doc.idToObject.get(xObjectName(smask.name)) is None:
+                doc.Reference(copy.copy(smask), xObjectName(smask.name))
+        canv._currentPageHasImages = 1
+        canv.saveState()
+        canv.translate(getattr(self, "_offs_x", 0), getattr(self, "_offs_y", 0))
+        canv.scale(self.drawWidth, self.drawHeight)
+        canv._code.append(f"/{reg_name} Do")
+        canv.restoreState()
+        canv._formsinuse.append(image.name)
+
+
+class StreamingStory(list):
+    """A story list that refills itself from an iterator of flowable lists.
+
+    BaseDocTemplate.build consumes its story from the front and polls len(),
+    so only the flowables of the payslip being laid out are held in memory.
+    """
+
+    def __init__(self, chunks):
+        super().__init__()
+        self._chunks = iter(chunks)
+
+    def __len__(self):
+        while not list.__len__(self):
+            try:
+                self.extend(next(self._chunks))
+            except StopIteration:
+                break
+        return list.__len__(self)
+
+
 class ModernPayslipGenerator:
     """Generate modern, clean payslip PDFs for employees."""
 
-    def __init__(self):
+    # Name of the form XObject holding the static header/footer artwork
+    STATIC_FORM_NAME = "PayslipStatic"
+
+    def __init__(self, optimised_output: bool = False):
+        """optimised_output: smallest files - the logo is downscaled to
+        LOGO_OPTIMISED_DPI. Page streams are compressed in both modes (ReportLab's
+        default), custom TTF fonts are always embedded as subsets, and the
+        Helvetica fallback is a standard font and is not embedded.
+        """
+        self.optimised_output = optimised_output
         self.styles = getSampleStyleSheet()
         self.font_name = register_fonts()
+        self._static_parts = None
+        self._static_lock = threading.Lock()  # GeneratorWarmup and PayslipWorker may race to build them
+        self._static_draw_lock = threading.Lock()  # the shared flowables hold the canvas while drawing
+        self._canvas_renderer = None
 
         # Modern color palette - define before setup_custom_styles()
         self.colors = {
@@ -188,6 +400,16 @@ class ModernPayslipGenerator:
             fontWeight='bold'
         )
 
+        self.footer_style = ParagraphStyle(
+            'Footer',
+            parent=self.styles['Normal'],
+            fontSize=9,
+            fontName=self.font_name,
+            textColor=self.colors['text_secondary'],
+            alignment=TA_CENTER,
+            leading=11
+        )
+
     def format_currency(self, amount):
         """Format currency with proper symbol"""
         if self.font_name == 'Helvetica':
@@ -198,6 +420,7 @@ class ModernPayslipGenerator:
 
 
 
+    @timed("section.header")
     def create_header_section(self, pay_period):
         """Create the header section with company logo + name in a single row"""
 
@@ -211,13 +434,16 @@ class ModernPayslipGenerator:
 
         if logo_path.exists():
             try:
-                logo = Image(str(logo_path))
-                logo.drawHeight = 25 * mm   # smaller logo
-                logo.drawWidth = 25 * mm
+                if self.optimised_output:
+                    logo = SharedImage(io.BytesIO(optimised_logo_png(str(logo_path))))
+                else:
+                    logo = SharedImage(str(logo_path))
+                logo.drawHeight = LOGO_SIZE   # smaller logo
+                logo.drawWidth = LOGO_SIZE
                 logo.hAlign = 'LEFT'
                 logo_flowable = logo
             except Exception as e:
-                print(f"Warning: Could not load logo: {e}")
+                log_event("logo_load_failed", logging.WARNING, logo_path=str(logo_path), error=str(e))
 
         # --- COMPANY INFO ---
         company_info = [
@@ -245,6 +471,7 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
         return header_table
     
 
+    @timed("section.summary_card")
     def create_employee_summary_card(self, emp, fin , pay_period: str):
         """Create the employee summary card with net pay highlight aligned perfectly"""
 
@@ -261,7 +488,7 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
             [Paragraph("Employee Name", self.label_style)],
             [Paragraph(f": {emp.get('name', 'N/A')}", self.value_style)],
             [Paragraph("Employee ID", self.label_style)],
-            [Paragraph(f": {emp.get('emp_code', 'N/A')}", self.value_style)],
+            [Paragraph(f": {emp.get('emp_code') or 'N/A'}", self.value_style)],
             [Paragraph("Pay Period", self.label_style)],
             [Paragraph(pay_period, self.value_style)],
             [Paragraph("Designation", self.label_style)],
@@ -309,6 +536,7 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
 
         return main_table
 
+    @timed("section.earnings_deductions")
     def create_earnings_deductions_section(self, fin):
         """Create earnings and deductions section"""
         from reportlab.platypus import Paragraph, Table, TableStyle
@@ -357,17 +585,15 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
         earnings_table_widths = [60*0.85*mm, 50*0.85*mm]
         deductions_table_widths = [60*0.85*mm, 50*0.85*mm]
 
-        # Create individual tables
-        earnings_table = Table(earnings_data, colWidths=earnings_table_widths)
-        deductions_table = Table(deductions_data, colWidths=deductions_table_widths)
-        earnings_table.setStyle(table_style)
-        deductions_table.setStyle(table_style)
-
-        # Force both tables to same height dynamically
-        total_height = max(earnings_table.wrap(0,0)[1], deductions_table.wrap(0,0)[1])
-        row_height = total_height / max_rows
-        earnings_table._argH = [row_height] * max_rows
-        deductions_table._argH = [row_height] * max_rows
+        # Force both tables to the same uniform row height: measure their natural
+        # heights, then build them with explicit rowHeights (changing _argH after
+        # wrap() leaves cells centred in their old row heights)
+        total_height = max(Table(earnings_data, colWidths=earnings_table_widths, style=table_style).wrap(0, 0)[1],
+                           Table(deductions_data, colWidths=deductions_table_widths, style=table_style).wrap(0, 0)[1])
+        row_heights = [total_height / max_rows] * max_rows
+        earnings_table = Table(earnings_data, colWidths=earnings_table_widths, rowHeights=row_heights, style=table_style)
+        deductions_table = Table(deductions_data, colWidths=deductions_table_widths, rowHeights=row_heights,
+                                 style=table_style)
 
         # Combine tables side by side with no gap
         main_earnings_table = Table([[earnings_table, deductions_table]],
@@ -383,6 +609,7 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
         return main_earnings_table
 
 
+    @timed("section.net_payable")
     def create_total_net_payable_section(self, fin):
         """Create the total net payable section"""
         net_payable_data = [
@@ -410,44 +637,31 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
 
         return net_payable_table
 
+    @timed("section.amount_in_words")
     def create_amount_in_words_section(self, fin):
         """Create amount in words section"""
-        try:
-            amt_words = num2words(fin['net'], to='currency', lang='en_IN')
-            amt_words = amt_words.replace("euro", "Rupees").replace("cents", "Paise")
-            amt_words = amt_words.title() + " Only"
+        with stage("num_to_words"):
+            amt_words = rupees_in_words(fin['net'])
 
-            words_data = [
-                [Paragraph(f"Amount In Words : {amt_words}", self.label_style)]
-            ]
+        words_data = [
+            [Paragraph(f"Amount In Words : {amt_words}", self.label_style)]
+        ]
 
-            words_table = Table(words_data, colWidths=[200*mm])
-            words_table.setStyle(TableStyle([
-                ('LEFTPADDING', (0,0), (-1,-1), 20),
-                ('RIGHTPADDING', (0,0), (-1,-1), 20),
-                ('TOPPADDING', (0,0), (-1,-1), 10),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 10),
-            ]))
+        words_table = Table(words_data, colWidths=[200*mm])
+        words_table.setStyle(TableStyle([
+            ('LEFTPADDING', (0,0), (-1,-1), 20),
+            ('RIGHTPADDING', (0,0), (-1,-1), 20),
+            ('TOPPADDING', (0,0), (-1,-1), 10),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 10),
+        ]))
 
-            return words_table
-        except Exception as e:
-            print(f"Warning: Could not convert amount to words: {e}")
-            return None
+        return words_table
 
+    @timed("section.footer")
     def create_footer_section(self):
         """Create footer section"""
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            fontName=self.font_name,
-            textColor=self.colors['text_secondary'],
-            alignment=TA_CENTER,
-            leading=11
-        )
-
         footer_data = [
-            [Paragraph("-- This is a system generated payslip, hence the signature is not required --", footer_style)]
+            [Paragraph("-- This is a system generated payslip, hence the signature is not required --", self.footer_style)]
         ]
 
         footer_table = Table(footer_data, colWidths=[200*mm])
@@ -460,38 +674,88 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
 
         return footer_table
 
-    def generate_pdf(self, db_path: str, employee_id: int, pay_period: str, output_dir: str) -> str:
-        """Generate modern PDF for a specific employee and pay period."""
-        # Setup output directory
-        out_dir = Path(output_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        # Get employee data
-        emp = get_employee_by_id(db_path, employee_id)
-        if not emp:
-            raise ValueError(f"Employee ID {employee_id} not found")
-
-        fin = compute_financials(emp)
-
-        # Create filename
-        safe_emp_code = str(emp.get('emp_code', employee_id)).replace('/', '_')
-        safe_period = pay_period.replace(' ', '_').replace('/', '_')
-        filename = out_dir / f"Payslip_{safe_emp_code}_{safe_period}.pdf"
-
-        # Create document with tighter margins for better space utilization
-        doc = SimpleDocTemplate(
-            str(filename),
+    def get_static_parts(self):
+        """Header and footer flowables, built and wrapped once per generator.
+
+        The logo SharedImage is kept alive with them, so the PNG is decoded and
+        encoded into a PDF image object once per generator, not once per document.
+        They are single instances (drawOn stores the canvas on them), so only
+        draw_static_template may draw them, one thread at a time.
+        """
+        if self._static_parts is None:
+            with self._static_lock:
+                if self._static_parts is None:
+                    header = self.create_header_section(None)
+                    footer = self.create_footer_section()
+                    header_w, header_h = header.wrap(A4[0], A4[1])
+                    footer_w, footer_h = footer.wrap(A4[0], A4[1])
+                    self._static_parts = (header, header_w, header_h, footer, footer_w, footer_h)
+        return self._static_parts
+
+    def static_header_height(self):
+        return self.get_static_parts()[2]
+
+    def draw_static_template(self, canv, doc):
+        """Page callback: stamp the shared header/footer form onto the page.
+
+        The form is recorded the first time it is needed in a document and every
+        page (including later pages of a multi-page document) just references it.
+        Recording is serialised, so threads may build documents concurrently.
+        """
+        if not canv.hasForm(self.STATIC_FORM_NAME):
+            header, header_w, header_h, footer, footer_w, footer_h = self.get_static_parts()
+            page_width, page_height = doc.pagesize
+            with self._static_draw_lock:
+                canv.beginForm(self.STATIC_FORM_NAME)
+                # Header sits where it used to as the first flowable in the frame
+                header.drawOn(canv, (page_width - header_w) / 2,
+                              page_height - doc.topMargin - FRAME_PADDING - header_h)
+                # Footer sits in the bottom margin, below the content frame
+                footer.drawOn(canv, (page_width - footer_w) / 2, doc.bottomMargin - footer_h)
+                canv.endForm()
+        canv.doForm(self.STATIC_FORM_NAME)
+
+    def create_document(self, target, **kwargs):
+        """Create the A4 document template every payslip PDF is built with.
+
+        Output is invariant (fixed timestamps and ids), so identical inputs give
+        byte-identical PDFs, which incremental regeneration relies on.
+        """
+        # Tighter margins for better space utilization
+        return SimpleDocTemplate(
+            target,
             pagesize=A4,
             rightMargin=10*mm,
             leftMargin=10*mm,
             topMargin=15*mm,
-            bottomMargin=15*mm
+            bottomMargin=15*mm,
+            invariant=1,
+            **kwargs
         )
 
+    def payslip_input_hash(self, emp, fin, pay_period: str, renderer: str = "platypus") -> str:
+        """Hash everything a payslip PDF is built from."""
+        inputs = {
+            "renderer": renderer,
+            "employee": {k: emp.get(k) for k in PAYSLIP_FIELDS},
+            "financials": fin,
+            "pay_period": pay_period,
+            "template_version": TEMPLATE_VERSION,
+            "font": self.font_name,
+            "optimised": self.optimised_output,
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def payslip_filename(self, emp, employee_id: int, pay_period: str, out_dir: Path) -> Path:
+        return payslip_filename(emp, employee_id, pay_period, out_dir)
+
+    def build_payslip_story(self, emp, fin, pay_period):
+        """Return the per-employee flowables of one payslip page."""
         story = []
 
-        # Build the document sections
-        story.append(self.create_header_section(pay_period))
+        # Build the document sections; the header and footer come from the
+        # static page template, so only reserve the header's space here
+        story.append(Spacer(1, self.static_header_height()))
         story.append(Spacer(1, 12))
 
         story.append(self.create_employee_summary_card(emp, fin ,  pay_period))
@@ -503,18 +767,156 @@ Paragraph("THANE - 401105", self.company_subtitle_style)
         story.append(self.create_total_net_payable_section(fin))
         story.append(Spacer(1, 8))
 
-        # Amount in words (if conversion works)
-        words_section = self.create_amount_in_words_section(fin)
-        if words_section:
-            story.append(words_section)
-            story.append(Spacer(1, 8))
+        story.append(self.create_amount_in_words_section(fin))
+        story.append(Spacer(1, 8))
+
+        return story
 
-        story.append(self.create_footer_section())
+    @timed("generate_pdf")
+    def generate_pdf(self, db_path: str, employee_id: int, pay_period: str, output_dir: str,
+                     renderer: str = "platypus") -> str:
+        """Generate modern PDF for a specific employee and pay period."""
+        # Setup output directory
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # Get employee data
+        with stage("db_fetch"):
+            emp = get_employee_by_id(db_path, employee_id)
+        if not emp:
+            raise ValueError(f"Employee ID {employee_id} not found")
+
+        filename = self.payslip_filename(emp, employee_id, pay_period, out_dir)
 
         # Build PDF
         try:
-            doc.build(story)
-            print(f"Modern payslip generated successfully: {filename}")
+            self.build_payslip(emp, pay_period, str(filename), renderer)
+            log_event("payslip_generated", employee_id=employee_id, pay_period=pay_period,
+                      path=str(filename), renderer=renderer)
             return str(filename)
         except Exception as e:
             raise Exception(f"Failed to generate PDF: {e}")
+
+    def build_payslip(self, emp, pay_period: str, target, renderer: str = "platypus"):
+        """Lay out one employee's payslip into target (a filename or binary file object)."""
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unknown renderer {renderer!r}; expected one of {RENDERERS}")
+        if renderer == "canvas":
+            if self._canvas_renderer is None:
+                from payslip_canvas import CanvasPayslipRenderer
+                self._canvas_renderer = CanvasPayslipRenderer(self)
+            with stage("canvas_render"):
+                self._canvas_renderer.render(emp, pay_period, target)
+            return
+
+        doc = self.create_document(target)
+        with stage("compute_financials"):
+            fin = compute_financials(emp)
+        story = self.build_payslip_story(emp, fin, pay_period)
+        with stage("doc_build"):
+            doc.build(story, onFirstPage=self.draw_static_template, onLaterPages=self.draw_static_template)
+
+    def render_pdf_bytes(self, emp, pay_period: str, renderer: str = "platypus") -> bytes:
+        """Render an employee dict's payslip entirely in memory and return the PDF bytes."""
+        buffer = io.BytesIO()
+        try:
+            self.build_payslip(emp, pay_period, buffer, renderer)
+        except Exception as e:
+            raise Exception(f"Failed to generate PDF: {e}")
+        return buffer.getvalue()
+
+    def generate_pdf_incremental(self, db_path: str, employee_id: int, pay_period: str, output_dir: str,
+                                 renderer: str = "platypus"):
+        """Like generate_pdf, but skip the build when the manifest shows the PDF is current.
+
+        Returns (filename, rebuilt). A payslip is rebuilt when its input hash
+        changed, the file is missing, or the file no longer matches its recorded
+        checksum.
+        """
+        out_dir = Path(output_dir)
+        emp = get_employee_by_id(db_path, employee_id)
+        if not emp:
+            raise ValueError(f"Employee ID {employee_id} not found")
+
+        fin = compute_financials(emp)
+        filename = self.payslip_filename(emp, employee_id, pay_period, out_dir)
+        input_hash = self.payslip_input_hash(emp, fin, pay_period, renderer)
+
+        entry = get_manifest_entry(db_path, str(filename))
+        if (entry and entry["input_hash"] == input_hash and filename.exists()
+                and file_sha256(filename) == entry["pdf_sha256"]):
+            return str(filename), False
+
+        filename = self.generate_pdf(db_path, employee_id, pay_period, output_dir, renderer)
+        upsert_manifest_entry(db_path, {
+            "output_path": filename,
+            "employee_id": employee_id,
+            "pay_period": pay_period,
+            "input_hash": input_hash,
+            "pdf_sha256": file_sha256(filename),
+            "template_version": TEMPLATE_VERSION,
+        })
+        return filename, True
+
+    def iter_consolidated_story(self, db_path, employee_ids, pay_period: str):
+        """Yield one chunk of flowables per employee for the consolidated PDF."""
+        conn = get_conn(Path(db_path))
+        try:
+            first = True
+            for employee_id in employee_ids:
+                emp = get_employee_by_id(conn, employee_id)
+                if not emp:
+                    continue
+                chunk = [] if first else [PageBreak()]
+                first = False
+                title = f"{emp.get('emp_code') or employee_id} - {emp.get('name', '')}"
+                chunk.append(OutlineEntry(f"emp_{employee_id}", title))
+                chunk.extend(self.build_payslip_story(emp, compute_financials(emp), pay_period))
+                yield chunk
+        finally:
+            conn.close()
+
+    def generate_consolidated_pdf(self, db_path: str, employee_ids, pay_period: str, output_path: str) -> str:
+        """Generate one multi-page PDF with a payslip page and bookmark per employee.
+
+        The story is streamed employee by employee, and the header/footer form,
+        font and logo are embedded once and shared by every page.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        def first_page(canv, doc):
+            canv.showOutline()
+            self.draw_static_template(canv, doc)
+
+        doc = self.create_document(str(output_path), title=f"Payslips - {pay_period}")
+        story = StreamingStory(self.iter_consolidated_story(db_path, employee_ids, pay_period))
+        try:
+            doc.build(story, onFirstPage=first_page, onLaterPages=self.draw_static_template)
+            log_event("consolidated_pdf_generated", pay_period=pay_period, path=str(output_path))
+            return str(output_path)
+        except Exception as e:
+            raise Exception(f"Failed to generate consolidated PDF: {e}")
+
+
+_generators = {}
+_generator_lock = threading.Lock()
+
+
+def get_generator(optimised: bool = False) -> ModernPayslipGenerator:
+    """Return the process-wide generator; fonts and styles are set up on first call only.
+
+    optimised selects the optimised-output generator (one cached instance per mode).
+    """
+    generator = _generators.get(optimised)
+    if generator is None:
+        with _generator_lock:
+            generator = _generators.get(optimised)
+            if generator is None:
+                generator = _generators[optimised] = ModernPayslipGenerator(optimised_output=optimised)
+    return generator
+
+
+def render_pdf_bytes(employee, pay_period: str, renderer: str = "platypus", optimised: bool = False) -> bytes:
+    """Render a payslip to bytes with the process-wide generator (no files touched)."""
+    return get_generator(optimised).render_pdf_bytes(employee, pay_period, renderer)
@@ -0,0 +1,173 @@
+# payslip_preview.py
+"""HTML preview of an employee's payslip for PayslipPage.
+
+The markup lives in string.Template objects filled with the escaped fields
+(substitute() scans the template on every call, so rendering is not free).
+PreviewCache keeps recently rendered previews keyed by (employee id, store
+row version), so revisiting an employee costs a dictionary lookup and any
+edit to the row invalidates its entry.
+"""
+from collections import OrderedDict
+from html import escape
+from string import Template
+from typing import Any, Dict
+
+from db import compute_financials
+
+PREVIEW_CACHE_SIZE = 256
+
+PREVIEW_TEMPLATE = Template("""
+<div style="padding: 24px; background: white; margin: 20px; border-radius: 16px; border: 1px solid #e5e7eb; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
+    <!-- Header -->
+    <div style="border-bottom: 2px solid #f1f5f9; padding-bottom: 20px; margin-bottom: 24px;">
+        <h2 style="color: #1f2937; margin: 0 0 8px 0; font-size: 22px; font-weight: 700;">
+            📋 Payslip Preview
+        </h2>
+        <div style="display: flex; align-items: center; gap: 8px;">
+            <span style="color: $status_color; font-weight: 600; font-size: 14px;">
+                $status_icon $status_text
+            </span>
+        </div>
+    </div>
+
+    <!-- Employee Details -->
+    <div style="background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%); padding: 20px; border-radius: 12px; margin-bottom: 24px;">
+        <h3 style="color: #374151; margin: 0 0 16px 0; font-size: 16px; font-weight: 600;">👤 Employee Information</h3>
+        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 12px; font-size: 14px;">
+            <div><span style="color: #6b7280; font-weight: 500;">Name:</span> <span style="color: #1f2937; font-weight: 600;">$name</span></div>
+            <div><span style="color: #6b7280; font-weight: 500;">Employee Code:</span> <span style="color: #1f2937; font-weight: 600;">$emp_code</span></div>
+            <div><span style="color: #6b7280; font-weight: 500;">Designation:</span> <span style="color: #1f2937;">$designation</span></div>
+            <div><span style="color: #6b7280; font-weight: 500;">Department:</span> <span style="color: #1f2937;">$department</span></div>
+            <div><span style="color: #6b7280; font-weight: 500;">Joining Date:</span> <span style="color: #1f2937;">$joining_date</span></div>
+            <div><span style="color: #6b7280; font-weight: 500;">Pay Period:</span> <span style="color: #7c3aed; font-weight: 600; font-style: italic;">To be entered during generation</span></div>
+        </div>
+    </div>
+
+    <!-- Earnings Breakdown -->
+    <div style="background: linear-gradient(135deg, #ecfdf5 0%, #f0fdf4 100%); padding: 20px; border-radius: 12px; margin-bottom: 20px; border-left: 4px solid #059669;">
+        <h3 style="color: #065f46; margin: 0 0 16px 0; font-size: 16px; font-weight: 600;">💰 Earnings Breakdown</h3>
+        <div style="font-size: 14px; line-height: 1.8;">
+            <div style="display: flex; justify-content: space-between; padding: 4px 0;">
+                <span style="color: #374151;">Basic Salary:</span>
+                <span style="color: #059669; font-weight: 600;">₹$basic</span>
+            </div>
+            <div style="display: flex; justify-content: space-between; padding: 4px 0;">
+                <span style="color: #374151;">HRA:</span>
+                <span style="color: #059669; font-weight: 600;">₹$hra</span>
+            </div>
+            <div style="display: flex; justify-content: space-between; padding: 4px 0;">
+                <span style="color: #374151;">LTA:</span>
+                <span style="color: #059669; font-weight: 600;">₹$LTA</span>
+            </div>
+            <div style="display: flex; justify-content: space-between; padding: 4px 0;">
+                <span style="color: #374151;">Special Allowance:</span>
+                <span style="color: #059669; font-weight: 600;">₹$special_allowance</span>
+            </div>
+        </div>
+    </div>
+
+    <!-- Deductions -->
+    <div style="background: linear-gradient(135deg, #fef2f2 0%, #fef7f7 100%); padding: 20px; border-radius: 12px; margin-bottom: 20px; border-left: 4px solid #dc2626;">
+        <h3 style="color: #991b1b; margin: 0 0 16px 0; font-size: 16px; font-weight: 600;">💳 Deductions</h3>
+        <div style="font-size: 14px; line-height: 1.8;">
+            <div style="display: flex; justify-content: space-between; padding: 4px 0;">
+                <span style="color: #374151;">Income Tax:</span>
+                <span style="color: #dc2626; font-weight: 600;">₹$income_tax</span>
+            </div>
+        </div>
+    </div>
+
+    <!-- Summary -->
+    <div style="background: linear-gradient(135deg, #eff6ff 0%, #f0f9ff 100%); padding: 24px; border-radius: 12px; border: 2px solid #3b82f6;">
+        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px;">
+            <span style="color: #1e40af; font-size: 16px; font-weight: 600;">💵 Gross Pay:</span>
+            <span style="color: #1e40af; font-size: 18px; font-weight: 700;">₹$gross</span>
+        </div>
+        <div style="display: flex; justify-content: space-between; align-items: center; padding-top: 12px; border-top: 1px solid #bfdbfe;">
+            <span style="color: #1e40af; font-size: 18px; font-weight: 700;">💸 Net Pay:</span>
+            <span style="color: #1e40af; font-size: 24px; font-weight: 900;">₹$net</span>
+        </div>
+    </div>
+
+    <!-- Bank Details (if available) -->
+    $bank_section
+
+    <!-- Notes (if available) -->
+    $notes_section
+</div>
+""")
+
+BANK_SECTION_TEMPLATE = Template("""
+<div style="background: #f8fafc; padding: 16px; border-radius: 8px; margin-top: 20px; border: 1px solid #e2e8f0;">
+    <h4 style="color: #475569; margin: 0 0 12px 0; font-size: 14px; font-weight: 600;">🏦 Bank Details</h4>
+    <div style="font-size: 13px; line-height: 1.6; color: #64748b;">
+        <div>Account: $bank_account</div>
+        <div>IFSC: $ifsc</div>
+        <div>PAN: $pan</div>
+    </div>
+</div>
+""")
+
+NOTES_SECTION_TEMPLATE = Template("""
+<div style="background: #fffbeb; padding: 16px; border-radius: 8px; margin-top: 16px; border-left: 3px solid #f59e0b;">
+    <h4 style="color: #92400e; margin: 0 0 8px 0; font-size: 14px; font-weight: 600;">📝 Notes</h4>
+    <p style="color: #78350f; font-size: 13px; margin: 0; line-height: 1.5;">$notes</p>
+</div>
+""")
+
+
+def _text(emp: Dict[str, Any], key: str, default: str = "N/A") -> str:
+    value = emp.get(key, default)
+    return escape(str(value if value is not None else default))
+
+
+def render_preview_html(emp: Dict[str, Any]) -> str:
+    """Render the preview markup for one employee row."""
+    fin = compute_financials(emp)
+    active = (emp.get('status') or '').lower() == 'active'
+    fields = {
+        "status_color": "#059669" if active else "#dc2626",
+        "status_text": "Active" if active else "Inactive",
+        "status_icon": "🟢" if active else "🔴",
+        "name": _text(emp, 'name'),
+        "emp_code": escape(str(emp.get('emp_code') or emp.get('id', 'N/A'))),
+        "designation": _text(emp, 'designation'),
+        "department": _text(emp, 'department'),
+        "joining_date": _text(emp, 'joining_date'),
+        "bank_account": _text(emp, 'bank_account'),
+        "ifsc": _text(emp, 'ifsc'),
+        "pan": _text(emp, 'pan'),
+        "notes": _text(emp, 'notes', ''),
+    }
+    for key in ("basic", "hra", "LTA", "special_allowance", "income_tax", "gross", "net"):
+        fields[key] = f"{fin[key]:,.2f}"
+    has_bank = emp.get('bank_account') or emp.get('ifsc') or emp.get('pan')
+    fields["bank_section"] = BANK_SECTION_TEMPLATE.substitute(fields) if has_bank else ""
+    fields["notes_section"] = NOTES_SECTION_TEMPLATE.substitute(fields) if (emp.get('notes') or '').strip() else ""
+    return PREVIEW_TEMPLATE.substitute(fields)
+
+
+class PreviewCache:
+    """Bounded LRU of rendered preview HTML keyed by (employee id, row version)."""
+
+    def __init__(self, maxsize: int = PREVIEW_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, emp: Dict[str, Any], row_version: int) -> str:
+        key = (emp["id"], row_version)
+        html = self._entries.get(key)
+        if html is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+        self.misses += 1
+        html = self._entries[key] = render_preview_html(emp)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        self._entries.clear()
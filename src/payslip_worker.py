@@ -0,0 +1,98 @@
+# payslip_worker.py
+import logging
+import time
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from db import get_employee_by_id
+from instrumentation import log_event
+
+
+class PayslipCancelled(Exception):
+    pass
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by PayslipWorker (delivered on the UI thread)."""
+    progress = pyqtSignal(int, str)      # percent, stage message
+    finished = pyqtSignal(str)           # output filename
+    cancelled = pyqtSignal()
+    error = pyqtSignal(str)
+
+
+class PayslipWorker(QRunnable):
+    """Generate one payslip PDF on a QThreadPool thread.
+
+    The PDF is rendered in memory and only written once rendering is done, so a
+    cancelled job never leaves a partial file behind.
+    """
+
+    def __init__(self, db_path, employee_id: int, pay_period: str, output_dir: str,
+                 renderer: str = "platypus"):
+        super().__init__()
+        self.db_path = db_path
+        self.employee_id = employee_id
+        self.pay_period = pay_period
+        self.output_dir = output_dir
+        self.renderer = renderer
+        self.signals = WorkerSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _check_cancelled(self):
+        if self._cancelled:
+            raise PayslipCancelled()
+
+    def run(self):
+        try:
+            self.signals.progress.emit(5, "Loading generator…")
+            from payslip_generator import get_generator
+            generator = get_generator()
+            self._check_cancelled()
+
+            self.signals.progress.emit(20, "Reading employee record…")
+            emp = get_employee_by_id(self.db_path, self.employee_id)
+            if not emp:
+                raise ValueError(f"Employee ID {self.employee_id} not found")
+            self._check_cancelled()
+
+            self.signals.progress.emit(40, "Rendering PDF…")
+            pdf_bytes = generator.render_pdf_bytes(emp, self.pay_period, self.renderer)
+            self._check_cancelled()
+
+            self.signals.progress.emit(90, "Saving file…")
+            out_dir = Path(self.output_dir)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            filename = generator.payslip_filename(emp, self.employee_id, self.pay_period, out_dir)
+            filename.write_bytes(pdf_bytes)
+            log_event("payslip_generated", employee_id=self.employee_id, pay_period=self.pay_period,
+                      path=str(filename), renderer=self.renderer)
+
+            self.signals.progress.emit(100, "Done")
+            self.signals.finished.emit(str(filename))
+        except PayslipCancelled:
+            log_event("payslip_cancelled", employee_id=self.employee_id, pay_period=self.pay_period)
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class GeneratorWarmup(QRunnable):
+    """Import ReportLab, register fonts and build the generator's styles off the UI thread.
+
+    Started once the main window has painted, so the first payslip does not pay
+    for it and startup does not either.
+    """
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            from payslip_generator import get_generator
+            get_generator().get_static_parts()
+        except Exception as e:
+            log_event("generator_warmup_failed", logging.WARNING, error=str(e))
+            return
+        log_event("generator_warmed_up", ms=round((time.perf_counter() - start) * 1000, 1))
@@ -0,0 +1,144 @@
+# search_pipeline.py
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+DEBOUNCE_MS = 150
+CANCEL_CHECK_EVERY = 512
+
+# (employee id, lower-cased search text) pairs, as matched by SearchTask
+SearchIndex = List[Tuple[int, str]]
+
+
+class SearchSignals(QObject):
+    done = pyqtSignal(int, str, object)  # generation, query, matching SearchIndex (None if cancelled)
+
+
+class SearchTask(QRunnable):
+    """Match one query against a candidate list on a pool thread."""
+
+    def __init__(self, generation: int, query: str, candidates: SearchIndex, pipeline: "SearchPipeline"):
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.candidates = candidates
+        self.pipeline = pipeline
+        self.signals = SearchSignals()
+
+    def run(self):
+        query, matches = self.query, []
+        for i, (emp_id, key) in enumerate(self.candidates):
+            if i % CANCEL_CHECK_EVERY == 0 and self.pipeline.generation != self.generation:
+                self.signals.done.emit(self.generation, query, None)  # superseded
+                return
+            if query in key:
+                matches.append((emp_id, key))
+        self.signals.done.emit(self.generation, query, matches)
+
+
+class SearchPipeline(QObject):
+    """Debounced, cancellable search over the employee directory.
+
+    submit() is called on every keystroke; the query runs DEBOUNCE_MS after
+    typing pauses, on QThreadPool. Each query gets a generation number: a
+    running query stops early once a newer one is submitted, and results of
+    any but the latest generation are dropped. A query that extends the last
+    completed one (typing more characters) only searches that query's matches.
+
+    results_ready emits the set of matching employee ids, or None for an
+    empty query (everything matches). current_ids() is that published set,
+    kept up to date by apply_change while a newer query is still running.
+    """
+
+    results_ready = pyqtSignal(object)
+
+    def __init__(self, parent=None, debounce_ms: int = DEBOUNCE_MS):
+        super().__init__(parent)
+        self.generation = 0
+        self.published = 0
+        self.query = ""
+        self._index: SearchIndex = []
+        self._last: Optional[Tuple[str, SearchIndex]] = None  # last completed (query, matches)
+        self._published: Optional[Tuple[str, frozenset]] = None  # (query, ids) the view is filtered by
+        self._tasks: Dict[int, SearchTask] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._start)
+
+    def set_index(self, rows: List[Dict[str, Any]], search_key) -> None:
+        """Replace the searchable rows (after a data reload) and re-run the current query."""
+        self._index = [(emp["id"], search_key(emp)) for emp in rows]
+        self._last = None
+        if self.query:
+            self._start()
+
+    def apply_change(self, emp_id: int, key: Optional[str]) -> None:
+        """Update one row's search text (None = deleted) in the index and the current results."""
+        self._index = [entry for entry in self._index if entry[0] != emp_id]
+        if key is not None:
+            self._index.append((emp_id, key))
+        if self._last:
+            query, matches = self._last
+            matches = [entry for entry in matches if entry[0] != emp_id]
+            if key is not None and query in key:
+                matches.append((emp_id, key))
+            self._last = (query, matches)
+        if self._published:
+            query, ids = self._published
+            ids = ids - {emp_id}
+            if key is not None and query in key:
+                ids = ids | {emp_id}
+            self._published = (query, ids)
+        if not self.is_idle() and not self._timer.isActive():
+            self._start()  # a query in flight may have missed the change
+
+    def current_ids(self):
+        """Ids matched by the last published query, or None when no search is applied.
+
+        While a newer query is pending this is still the published set (with
+        single-row changes applied), never None, so the view stays filtered.
+        """
+        return self._published[1] if self._published else None
+
+    def submit(self, text: str) -> None:
+        self.query = (text or "").strip().lower()
+        self.generation += 1  # supersedes any running query right away
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Run a pending (debounced) query now."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._start()
+
+    def is_idle(self) -> bool:
+        return not self._timer.isActive() and self.published == self.generation
+
+    def _start(self) -> None:
+        self.generation += 1
+        generation, query = self.generation, self.query
+        if not query:
+            self._last = None
+            self._publish(generation, query, None)
+            return
+        if self._last and query.startswith(self._last[0]):
+            candidates = self._last[1]  # refine the previous result set
+        else:
+            candidates = self._index
+        task = SearchTask(generation, query, candidates, self)
+        task.signals.done.connect(self._on_done)
+        self._tasks[generation] = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_done(self, generation: int, query: str, matches) -> None:
+        self._tasks.pop(generation, None)
+        if matches is None or generation != self.generation:
+            return  # cancelled or stale
+        self._last = (query, matches)
+        self._publish(generation, query, frozenset(emp_id for emp_id, _ in matches))
+
+    def _publish(self, generation: int, query: str, ids) -> None:
+        self.published = generation
+        self._published = (query, ids) if ids is not None else None
+        self.results_ready.emit(ids)
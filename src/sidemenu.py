@@ -19,29 +19,6 @@ class SidebarButton(QPushButton):
         self.setObjectName("sidebarButton")
         self.setMinimumHeight(50)
 
-        # Styling
-        self.setStyleSheet("""
-            QPushButton#sidebarButton {
-                background: transparent;
-                border: none;
-                color: #64748b;
-                font-size: 15px;
-                font-weight: 500;
-                text-align: left;
-                padding: 12px 24px;
-                border-radius: 12px;
-            }
-            QPushButton#sidebarButton:hover {
-                background: rgba(59, 130, 246, 0.1);
-                color: #3b82f6;
-            }
-            QPushButton#sidebarButton:checked {
-                background: rgba(59, 130, 246, 0.15);
-                color: #1e3a8a;
-                font-weight: 600;
-            }
-        """)
-
 
 class ModernSidebar(QFrame):
     page_changed = pyqtSignal(int)
@@ -77,7 +54,7 @@ class ModernSidebar(QFrame):
         if logo_pix.isNull():
             #QMessageBox.warning(None, "Debug", f"Failed to load QPixmap from:\n{LOGO_PATH}")
             logo_label.setText("🏥")  # fallback
-            logo_label.setStyleSheet("font-size: 24px;")
+            logo_label.setObjectName("logoFallback")
         else:
             logo_pix = logo_pix.scaled(
                 40, 40,
@@ -92,12 +69,7 @@ class ModernSidebar(QFrame):
 
         # Company Name
         company_label = QLabel("Mariomed\nPharmaceuticals")
-        company_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 700;
-            color: #1e293b;
-            line-height: 1.2;
-        """)
+        company_label.setObjectName("companyName")
         brand_layout.addWidget(company_label)
         brand_layout.addStretch()
 
@@ -123,22 +95,10 @@ class ModernSidebar(QFrame):
 
         # ===== Footer =====
         footer = QLabel("v1.0 • Modern UI")
-        footer.setStyleSheet("""
-            color: #94a3b8;
-            font-size: 11px;
-            padding: 12px 20px;
-        """)
+        footer.setObjectName("sidebarFooter")
         footer.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(footer)
 
-        # Sidebar styling
-        self.setStyleSheet("""
-            QFrame#sidebar {
-                background: #ffffff;
-                border-right: 1px solid #e2e8f0;
-            }
-        """)
-
     def on_button_clicked(self, index):
         # Uncheck all other buttons
         for i, btn in enumerate(self.nav_buttons):
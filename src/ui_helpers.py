@@ -3,8 +3,8 @@ from PyQt6.QtWidgets import (
     QLabel, QFrame, QVBoxLayout, QHBoxLayout, QPushButton,
     QLineEdit, QWidget, QGraphicsDropShadowEffect
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect
-from PyQt6.QtGui import QPainter, QPainterPath, QColor, QFont
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QTimer
+from PyQt6.QtGui import QPainter, QPainterPath, QColor, QFont, QPen
 
 
 class CenteredLabel(QLabel):
@@ -30,24 +30,11 @@ class ModernCard(QFrame):
 
         if title:
             self.title_label = QLabel(title)
-            self.title_label.setStyleSheet("""
-                font-size: 18px;
-                font-weight: 600;
-                color: #1f2937;
-                margin-bottom: 8px;
-            """)
+            self.title_label.setObjectName("cardTitle")
             self.layout.addWidget(self.title_label)
 
     def setup_style(self):
-        self.setStyleSheet("""
-            QFrame#modernCard {
-                background-color: white;
-                border-radius: 16px;
-                border: 1px solid #e5e7eb;
-            }
-        """)
-
-        # Add subtle shadow
+        # Colours come from QFrame#modernCard in styles/style.qss; add subtle shadow
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(20)
         shadow.setOffset(0, 4)
@@ -62,58 +49,14 @@ class ModernCard(QFrame):
 
 
 class GlassButton(QPushButton):
-    """Modern glass-morphism style button."""
+    """Modern glass-morphism style button (QPushButton#glassButton[primary] in style.qss)."""
 
     def __init__(self, text, primary=False, parent=None):
         super().__init__(text, parent)
         self.primary = primary
+        self.setObjectName("glassButton")
+        self.setProperty("primary", primary)
         self.setMinimumHeight(44)
-        self.setup_style()
-
-    def setup_style(self):
-        if self.primary:
-            style = """
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #3b82f6, stop:1 #1d4ed8);
-                    color: white;
-                    border: none;
-                    border-radius: 12px;
-                    font-size: 14px;
-                    font-weight: 600;
-                    padding: 12px 24px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #2563eb, stop:1 #1e40af);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #1d4ed8, stop:1 #1e3a8a);
-                }
-            """
-        else:
-            style = """
-                QPushButton {
-                    background: rgba(255, 255, 255, 0.9);
-                    color: #374151;
-                    border: 2px solid #e5e7eb;
-                    border-radius: 12px;
-                    font-size: 14px;
-                    font-weight: 500;
-                    padding: 12px 24px;
-                }
-                QPushButton:hover {
-                    background: white;
-                    border-color: #3b82f6;
-                    color: #3b82f6;
-                }
-                QPushButton:pressed {
-                    background: #f8fafc;
-                }
-            """
-
-        self.setStyleSheet(style)
 
 
 class ModernInput(QLineEdit):
@@ -123,39 +66,25 @@ class ModernInput(QLineEdit):
         super().__init__(parent)
         if placeholder:
             self.setPlaceholderText(placeholder)
+        self.setObjectName("modernInput")
         self.setMinimumHeight(44)
-        self.setup_style()
-
-    def setup_style(self):
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: white;
-                border: 2px solid #e5e7eb;
-                border-radius: 12px;
-                padding: 12px 16px;
-                font-size: 14px;
-                color: #374151;
-            }
-            QLineEdit:focus {
-                border-color: #3b82f6;
-                outline: none;
-            }
-            QLineEdit::placeholder {
-                color: #9ca3af;
-            }
-        """)
 
 
 class StatsCard(QFrame):
-    """A card for displaying statistics."""
+    """A card for displaying statistics.
+
+    accent ("blue", "green" or "purple") picks the colour of the left border,
+    icon and value from style.qss.
+    """
 
-    def __init__(self, title, value, subtitle="", icon="", color="#3b82f6", parent=None):
+    def __init__(self, title, value, subtitle="", icon="", accent="blue", parent=None):
         super().__init__(parent)
         self.setObjectName("statsCard")
-        self.init_ui(title, value, subtitle, icon, color)
-        self.setup_style(color)
+        self.setProperty("accent", accent)
+        self.init_ui(title, value, subtitle, icon)
+        self.setup_style()
 
-    def init_ui(self, title, value, subtitle, icon, color):
+    def init_ui(self, title, value, subtitle, icon):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(8)
@@ -165,54 +94,27 @@ class StatsCard(QFrame):
 
         if icon:
             self.icon_label = QLabel(icon)
-            self.icon_label.setStyleSheet(f"""
-                font-size: 24px;
-                color: {color};
-                min-width: 32px;
-            """)
+            self.icon_label.setObjectName("statsIcon")
             header.addWidget(self.icon_label)
 
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 500;
-            color: #6b7280;
-        """)
+        self.title_label.setObjectName("statsTitle")
         header.addWidget(self.title_label)
         header.addStretch()
         layout.addLayout(header)
 
         # Value
         self.value_label = QLabel(str(value))
-        self.value_label.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: 700;
-            color: {color};
-            margin: 4px 0;
-        """)
+        self.value_label.setObjectName("statsValue")
         layout.addWidget(self.value_label)
 
         # Subtitle
         if subtitle:
             self.subtitle_label = QLabel(subtitle)
-            self.subtitle_label.setStyleSheet("""
-                font-size: 12px;
-                color: #9ca3af;
-            """)
+            self.subtitle_label.setObjectName("statsSubtitle")
             layout.addWidget(self.subtitle_label)
 
-    def setup_style(self, color):
-        self.setStyleSheet(f"""
-            QFrame#statsCard {{
-                background-color: white;
-                border-radius: 12px;
-                border-left: 4px solid {color};
-                border-top: 1px solid #e5e7eb;
-                border-right: 1px solid #e5e7eb;
-                border-bottom: 1px solid #e5e7eb;
-            }}
-        """)
-
+    def setup_style(self):
         # Add subtle shadow
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(15)
@@ -225,24 +127,15 @@ class StatsCard(QFrame):
         self.value_label.setText(new_value)
 
 class ModernLabel(QLabel):
-    """Enhanced label with modern styling."""
+    """Enhanced label with modern styling.
+
+    style_type is one of normal, title, subtitle, caption, success, error or
+    warning (QLabel[styleType=...] in style.qss).
+    """
 
     def __init__(self, text="", style_type="normal", parent=None):
         super().__init__(text, parent)
-        self.setup_style(style_type)
-
-    def setup_style(self, style_type):
-        styles = {
-            "normal": "color: #374151; font-size: 14px;",
-            "title": "color: #1f2937; font-size: 20px; font-weight: 600;",
-            "subtitle": "color: #6b7280; font-size: 16px; font-weight: 500;",
-            "caption": "color: #9ca3af; font-size: 12px;",
-            "success": "color: #059669; font-size: 14px; font-weight: 500;",
-            "error": "color: #dc2626; font-size: 14px; font-weight: 500;",
-            "warning": "color: #d97706; font-size: 14px; font-weight: 500;",
-        }
-
-        self.setStyleSheet(styles.get(style_type, styles["normal"]))
+        self.setProperty("styleType", style_type)
 
 
 class LoadingSpinner(QWidget):
@@ -253,13 +146,22 @@ class LoadingSpinner(QWidget):
         self.setFixedSize(40, 40)
         self.angle = 0
 
-        # Animation
-        self.animation = QPropertyAnimation(self, b"rotation")
-        self.animation.setDuration(1000)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(360)
-        self.animation.setLoopCount(-1)  # Infinite loop
-        self.animation.start()
+        # Animation: advance the arc while running
+        self.timer = QTimer(self)
+        self.timer.setInterval(30)
+        self.timer.timeout.connect(self.rotate)
+
+    def start(self):
+        self.show()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.hide()
+
+    def rotate(self):
+        self.angle = (self.angle + 10) % 360
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -267,10 +169,10 @@ class LoadingSpinner(QWidget):
 
         # Draw spinner
         rect = self.rect().adjusted(5, 5, -5, -5)
-        painter.setPen(QColor(59, 130, 246))  # Blue color
-        painter.drawArc(rect, self.angle * 16, 120 * 16)
-
-        self.angle = (self.angle + 10) % 360
+        pen = QPen(QColor(59, 130, 246))  # Blue color
+        pen.setWidth(3)
+        painter.setPen(pen)
+        painter.drawArc(rect, -self.angle * 16, 120 * 16)
 
 
 class ActionButton(QPushButton):
@@ -278,28 +180,11 @@ class ActionButton(QPushButton):
 
     def __init__(self, icon="", parent=None):
         super().__init__(icon, parent)
+        self.setObjectName("actionButton")
         self.setFixedSize(56, 56)
         self.setup_style()
 
     def setup_style(self):
-        self.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #3b82f6, stop:1 #1d4ed8);
-                color: white;
-                border: none;
-                border-radius: 28px;
-                font-size: 18px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #2563eb, stop:1 #1e40af);
-            }
-            QPushButton:pressed {
-            }
-        """)
-
         # Add shadow
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(20)
@@ -0,0 +1,61 @@
+# test_renderers.py
+"""The canvas fast path must put the same text where platypus does.
+
+Uses bench_renderers.compare (text runs and positions from both PDFs) over
+employees chosen to make cells wrap and rows grow.
+"""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bench_renderers import SAMPLE_EMPLOYEE, compare, synthetic_employee  # noqa: E402
+
+pytest.importorskip("pypdf")
+
+PAY_PERIOD = "December 2025"
+
+
+def employee(**fields) -> dict:
+    emp = dict(SAMPLE_EMPLOYEE)
+    emp.update(fields)
+    return emp
+
+
+EDGE_CASES = {
+    "sample": employee(),
+    "long name": employee(name="Venkata Satya Sai Lakshmi Narasimha Subrahmanya Prasad Chakravarthula"),
+    "unbroken long name": employee(name="Thiruvananthapuramkanyakumarisubramaniamvenkatesan"),
+    "long designation": employee(designation="Principal Research Scientist, Process Analytical Technology & Validation"),
+    "long name and designation": employee(name="Alexandria Konstantinopoulou-Venkataraman Iyer",
+                                          designation="Associate Vice President - Global Regulatory Affairs"),
+    "long department": employee(department="Research, Development and Quality Assurance Operations"),
+    "crore amounts": employee(basic=98_76_543.21, hra=12_34_567.89, LTA=4_56_789.01,
+                              special_allowance=7_77_777.77, income_tax=23_45_678.9),
+    "hundred crore": employee(basic=1_23_45_67_890.55, hra=0.0, LTA=0.0, special_allowance=0.01, income_tax=0.0),
+    "one rupee one paisa": employee(basic=1.01, hra=0.0, LTA=0.0, special_allowance=0.0, income_tax=0.0),
+    "zero pay": employee(basic=0.0, hra=0.0, LTA=0.0, special_allowance=0.0, income_tax=0.0),
+    "no code or pan": employee(emp_code=None, pan=None),
+    "inactive": employee(status="Inactive"),
+}
+
+
+@pytest.mark.parametrize("emp", EDGE_CASES.values(), ids=EDGE_CASES.keys())
+def test_renderers_agree(emp):
+    assert compare(emp, PAY_PERIOD) == []
+
+
+def test_renderers_agree_on_synthetic_workforce():
+    rng = random.Random(0)
+    problems = {}
+    for i in range(1, 41):
+        emp = synthetic_employee(i, rng)
+        emp["name"] = " ".join(rng.choice(["Asha", "Venkatanarasimha", "Rao", "Chakraborty-Iyer", "Lakshmi",
+                                           "Subrahmanyam", "D'Souza", "Ng"]) for _ in range(rng.randint(1, 6)))
+        found = compare(emp, PAY_PERIOD)
+        if found:
+            problems[emp["name"]] = found
+    assert problems == {}
@@ -0,0 +1,63 @@
+# test_shared_image.py
+"""SharedImage must embed exactly what a plain Image does, in every document.
+
+It re-implements private parts of ReportLab's drawImage, so this is the test
+to run when changing the pinned ReportLab range (SHARED_IMAGE_REPORTLAB).
+"""
+import hashlib
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import payslip_generator  # noqa: E402
+from bench_renderers import SAMPLE_EMPLOYEE  # noqa: E402
+from payslip_generator import ModernPayslipGenerator, SharedImage  # noqa: E402
+
+PdfReader = pytest.importorskip("pypdf").PdfReader
+
+PAY_PERIOD = "December 2025"
+
+
+def embedded_images(pdf: bytes):
+    """(image data hash, soft mask data hash) of every image XObject on page 1."""
+    found = []
+
+    def walk(resources):
+        for xobject in resources.get("/XObject", {}).values():
+            xobject = xobject.get_object()
+            if xobject["/Subtype"] == "/Image":
+                smask = xobject["/SMask"].get_object().get_data() if "/SMask" in xobject else b""
+                found.append((hashlib.md5(xobject.get_data()).hexdigest(), hashlib.md5(smask).hexdigest()))
+            elif "/Resources" in xobject:
+                walk(xobject["/Resources"])
+
+    walk(PdfReader(io.BytesIO(pdf)).pages[0]["/Resources"])
+    return found
+
+
+@pytest.mark.parametrize("optimised", [False, True])
+def test_shared_image_matches_plain_image(optimised, monkeypatch):
+    if not SharedImage.supported:
+        pytest.skip("ReportLab release outside SHARED_IMAGE_REPORTLAB")
+    generator = ModernPayslipGenerator(optimised_output=optimised)
+    shared = [embedded_images(generator.render_pdf_bytes(SAMPLE_EMPLOYEE, PAY_PERIOD)) for _ in range(2)]
+
+    monkeypatch.setattr(SharedImage, "supported", False)
+    plain = embedded_images(ModernPayslipGenerator(optimised_output=optimised)
+                            .render_pdf_bytes(SAMPLE_EMPLOYEE, PAY_PERIOD))
+
+    assert plain, "the logo should be embedded"
+    assert shared[0] == shared[1] == plain
+
+
+def test_concurrent_renders_share_one_generator():
+    generator = payslip_generator.get_generator()
+    expected = generator.render_pdf_bytes(SAMPLE_EMPLOYEE, PAY_PERIOD)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: generator.render_pdf_bytes(SAMPLE_EMPLOYEE, PAY_PERIOD), range(16)))
+    assert all(pdf == expected for pdf in results)